@@ -9,15 +9,17 @@ import logging
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
+from sqlalchemy import insert, or_, func, text
 import asyncio
+from collections import deque
+import numpy as np
 
 from .spell_corrector import SpellCorrector
 from .semantic_search import SemanticMatcher, FuzzyMatcher
 from ..database.models import WorkMetadata, SearchLog
-from ..database.connection import get_db_context
+from ..database.connection import get_db_context, fts_available, work_fts, WORK_FTS_TABLE
 from ..data_collection.collector import get_collector
-from ..utils import normalize_title, generate_session_id
+from ..utils import normalize_title, generate_session_id, blob_to_embedding
 from ..config import get_settings
 from ..schemas import SearchResult, SearchResponse
 import re
@@ -45,6 +47,14 @@ CREATIVE_KEYWORDS = {
 }
 
 
+
+def _fts_prefix_term(text: str) -> Optional[str]:
+    """FTS5 prefix query for a normalized word or phrase; None when it has no word characters"""
+    if not any(ch.isalnum() for ch in text):
+        return None
+    return '"' + text.replace('"', '""') + '"*'
+
+
 class AISearchEngine:
     """
     Intelligent search engine that:
@@ -65,6 +75,14 @@ class AISearchEngine:
         self.phrase_weight = 0.25     # Multi-word phrase matching
         self.semantic_weight = 0.25   # Semantic similarity
         self.fuzzy_weight = 0.15      # Fuzzy character matching
+        
+        # Response cache: (expires_at, normalized query, unit vector, options, response)
+        self._response_cache: deque = deque(maxlen=settings.SEMANTIC_CACHE_SIZE)
+        
+        # Buffered SearchLog rows, written in bulk by the flusher task
+        self._log_buffer: List[Dict[str, Any]] = []
+        self._log_flush_task: Optional[asyncio.Task] = None
+        self._log_flush_wakeup: Optional[asyncio.Event] = None
     
     def _analyze_query(self, query: str) -> Dict[str, Any]:
         """
@@ -129,20 +147,122 @@ class AISearchEngine:
         
         logger.info(f"Search: '{query}' -> '{corrected_query}' (corrected: {was_corrected})")
         
+        # Repeated (or, with an embedding model, near-duplicate) queries hit the cache
+        options = (content_type, max_results, include_web_results)
+        normalized = normalize_title(query)
+        query_vec = None
+        if self.semantic_matcher.uses_model:
+            query_vec = await asyncio.to_thread(self._embed_query, query)
+        
+        cached = self._get_cached_response(normalized, query_vec, options)
+        if cached is not None:
+            return self._serve_cached(
+                query, corrected_query, was_corrected, cached,
+                content_type, session_id, db, start_time
+            )
+        
         # Step 2: Search in local database
         if db is None:
             with get_db_context() as db:
-                return await self._execute_search(
+                response = await self._execute_search(
                     query, corrected_query, was_corrected,
                     content_type, max_results, include_web_results,
                     session_id, db, start_time
                 )
         else:
-            return await self._execute_search(
+            response = await self._execute_search(
                 query, corrected_query, was_corrected,
                 content_type, max_results, include_web_results,
                 session_id, db, start_time
             )
+        
+        # Empty responses are not cached so a failed web lookup is retried
+        if response.results:
+            expires_at = time.monotonic() + settings.SEMANTIC_CACHE_TTL_SECONDS
+            self._response_cache.append((expires_at, normalized, query_vec, options, response))
+        
+        return response
+    
+    def _embed_query(self, query: str) -> Optional[np.ndarray]:
+        """Unit-length float32 model embedding of a query, or None if unavailable"""
+        vec = self.semantic_matcher.encode_uncached(query)
+        if vec is None:
+            return None
+        vec = np.asarray(vec, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        if norm == 0:
+            return None
+        return vec / norm
+    
+    def _get_cached_response(
+        self,
+        normalized: str,
+        query_vec: Optional[np.ndarray],
+        options: Tuple
+    ) -> Optional[SearchResponse]:
+        """Find a live cached response for the same or a semantically equivalent query"""
+        now = time.monotonic()
+        
+        for expires_at, cached_text, vec, cached_options, response in reversed(self._response_cache):
+            if expires_at < now or cached_options != options:
+                continue
+            if cached_text == normalized:
+                return response
+            if query_vec is not None and vec is not None and vec.shape == query_vec.shape:
+                if float(np.dot(query_vec, vec)) >= settings.SEMANTIC_CACHE_THRESHOLD:
+                    return response
+        
+        return None
+    
+    def _serve_cached(
+        self,
+        original_query: str,
+        corrected_query: str,
+        was_corrected: bool,
+        cached: SearchResponse,
+        content_type: Optional[str],
+        session_id: str,
+        db: Optional[Session],
+        start_time: float
+    ) -> SearchResponse:
+        """Rebuild the query-specific parts of a cached response and log the search"""
+        # SearchResult exposes the title/creator/content_type the generators read
+        ranked_results = [(result, result.similarity_score) for result in cached.results]
+        
+        ai_explanation = self._generate_explanation(
+            original_query, corrected_query, was_corrected,
+            ranked_results, content_type
+        )
+        suggestions = self._generate_suggestions(corrected_query, ranked_results, db)
+        
+        search_time_ms = int((time.time() - start_time) * 1000)
+        if db is None:
+            with get_db_context() as log_db:
+                self._log_search(
+                    original_query, corrected_query,
+                    len(ranked_results), session_id,
+                    search_time_ms, log_db
+                )
+        else:
+            self._log_search(
+                original_query, corrected_query,
+                len(ranked_results), session_id,
+                search_time_ms, db
+            )
+        
+        return SearchResponse(
+            query=original_query,
+            corrected_query=corrected_query if was_corrected else None,
+            results=cached.results,
+            total_found=len(cached.results),
+            search_time_ms=search_time_ms,
+            ai_explanation=ai_explanation,
+            suggestions=suggestions
+        )
+    
+    def clear_response_cache(self):
+        """Drop cached search responses (call after new data is written)"""
+        self._response_cache.clear()
     
     async def _execute_search(
         self,
@@ -175,7 +295,11 @@ class AISearchEngine:
         # Step 3: Web search if needed (collect new data)
         if include_web_results and len(all_results) < max_results:
             collector = get_collector()
-            new_works = await collector.collect_for_query(search_query, content_type, db)
+            new_works = await collector.collect_for_query(
+                search_query, content_type, db, top_k=max_results
+            )
+            if new_works:
+                self.clear_response_cache()
             
             # Score the new works with query analysis
             for work in new_works:
@@ -263,6 +387,7 @@ class AISearchEngine:
             results.append((work, 1.0))
         
         # Strategy 2: Full phrase contains match
+        # Plain LIKE: the FTS index only matches from word starts, this also finds "oby" in "moby"
         contains_matches = base_query.filter(
             WorkMetadata.title_normalized.contains(normalized_query)
         ).limit(limit).all()
@@ -275,13 +400,10 @@ class AISearchEngine:
         # Strategy 3: Multi-word matching with minimum overlap requirement
         if len(query_words) > 1:
             # For phrases, require multiple words to match
-            word_conditions = [
-                WorkMetadata.title_normalized.contains(word)
-                for word in query_words if len(word) > 2  # Skip short words
-            ]
+            match_words = [word for word in query_words if len(word) > 2]  # Skip short words
             
-            if word_conditions:
-                word_matches = base_query.filter(or_(*word_conditions)).limit(limit * 2).all()
+            if match_words:
+                word_matches = self._title_word_matches(base_query, match_words, limit * 2)
                 
                 for work in word_matches:
                     if work not in [r[0] for r in results]:
@@ -299,11 +421,7 @@ class AISearchEngine:
                             results.append((work, score))
         else:
             # Single word query - standard matching
-            word_conditions = [
-                WorkMetadata.title_normalized.contains(word)
-                for word in query_words
-            ]
-            word_matches = base_query.filter(or_(*word_conditions)).limit(limit).all()
+            word_matches = self._title_word_matches(base_query, query_words, limit)
             
             for work in word_matches:
                 if work not in [r[0] for r in results]:
@@ -313,22 +431,46 @@ class AISearchEngine:
         # Strategy 4: Semantic similarity (for remaining slots)
         if len(results) < limit:
             all_works = base_query.limit(limit * 3).all()
-            candidates = [(w.id, w.title) for w in all_works if w not in [r[0] for r in results]]
+            candidate_works = [w for w in all_works if w not in [r[0] for r in results]]
             
-            if candidates:
+            if candidate_works:
+                # Stored title embeddings come from the model, so TF-IDF mode recomputes
+                stored = None
+                if self.semantic_matcher.uses_model:
+                    stored = [
+                        blob_to_embedding(w.title_embedding) if w.title_embedding else None
+                        for w in candidate_works
+                    ]
                 semantic_results = self.semantic_matcher.find_similar(
-                    query, candidates, 
+                    query, [(w.id, w.title) for w in candidate_works],
                     top_k=limit - len(results),
-                    min_similarity=settings.MIN_SIMILARITY_THRESHOLD
+                    min_similarity=settings.MIN_SIMILARITY_THRESHOLD,
+                    embeddings=stored
                 )
                 
                 for work_id, title, sim_score in semantic_results:
-                    work = db.query(WorkMetadata).filter(WorkMetadata.id == work_id).first()
+                    work = db.get(WorkMetadata, work_id)
                     if work:
                         results.append((work, sim_score))
         
         return results
     
+    def _title_word_matches(self, base_query, words: List[str], limit: int) -> List[WorkMetadata]:
+        """Works whose title contains any of the words: FTS5 prefix terms if indexed, else LIKE"""
+        terms = [term for term in map(_fts_prefix_term, words) if term] if fts_available() else []
+        if terms:
+            return self._fts_ranked(base_query, ' OR '.join(terms), limit)
+        
+        word_conditions = [WorkMetadata.title_normalized.contains(word) for word in words]
+        return base_query.filter(or_(*word_conditions)).limit(limit).all()
+    
+    @staticmethod
+    def _fts_ranked(query, fts_query: str, limit: int) -> List[WorkMetadata]:
+        """Rows of a WorkMetadata query whose title matches an FTS5 query, best BM25 rank first"""
+        return query.join(work_fts, work_fts.c.rowid == WorkMetadata.id).filter(
+            text(f"{WORK_FTS_TABLE} MATCH :fts_query").bindparams(fts_query=fts_query)
+        ).order_by(text(f"bm25({WORK_FTS_TABLE})")).limit(limit).all()
+    
     def _calculate_relevance_score(
         self, 
         query: str, 
@@ -560,22 +702,85 @@ class AISearchEngine:
         db: Session
     ):
         """Log search for learning and analytics"""
+        entry = {
+            'query_text': original_query,
+            'query_normalized': normalize_title(original_query),
+            'corrected_query': corrected_query if corrected_query != original_query else None,
+            'result_count': result_count,
+            'was_successful': result_count > 0,
+            'search_time_ms': search_time_ms,
+            'session_id': session_id,
+            'timestamp': datetime.utcnow()
+        }
+        
+        if self._log_flush_task is not None:
+            self._log_buffer.append(entry)
+            if len(self._log_buffer) >= settings.LOG_BATCH_MAX_SIZE:
+                self._log_flush_wakeup.set()
+            return
+        
         try:
-            log_entry = SearchLog(
-                query_text=original_query,
-                query_normalized=normalize_title(original_query),
-                corrected_query=corrected_query if corrected_query != original_query else None,
-                result_count=result_count,
-                was_successful=result_count > 0,
-                search_time_ms=search_time_ms,
-                session_id=session_id,
-                timestamp=datetime.utcnow()
-            )
-            db.add(log_entry)
+            db.add(SearchLog(**entry))
             db.commit()
         except Exception as e:
             logger.error(f"Error logging search: {e}")
     
+    async def start_log_flusher(self):
+        """Start buffering search logs and flushing them in batches"""
+        if self._log_flush_task is not None:
+            return
+        self._log_flush_wakeup = asyncio.Event()
+        self._log_flush_task = asyncio.create_task(self._log_flush_loop())
+        logger.info(f"Search log batching enabled ({settings.LOG_BATCH_INTERVAL_MS}ms interval)")
+    
+    async def stop_log_flusher(self):
+        """Stop the flusher and write out anything still buffered"""
+        task, self._log_flush_task = self._log_flush_task, None
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush_search_logs()
+    
+    async def _log_flush_loop(self):
+        """Drain the search log buffer every interval, or early once it is full"""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._log_flush_wakeup.wait(),
+                    timeout=settings.LOG_BATCH_INTERVAL_MS / 1000
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._log_flush_wakeup.clear()
+            await self.flush_search_logs()
+    
+    async def flush_search_logs(self):
+        """Write all buffered search logs in a single transaction"""
+        # Swapping the list needs no lock: nothing awaits between read and reset
+        batch, self._log_buffer = self._log_buffer, []
+        if not batch:
+            return
+        
+        try:
+            await asyncio.to_thread(self._write_log_batch, batch)
+        except Exception as e:
+            logger.error(f"Error flushing {len(batch)} search logs: {e}")
+            # Requeue ahead of newer rows, keeping the buffer bounded
+            overflow = len(batch) + len(self._log_buffer) - settings.LOG_BATCH_MAX_SIZE
+            if overflow > 0:
+                logger.warning(f"Dropping {min(overflow, len(batch))} buffered search logs")
+            self._log_buffer[:0] = batch[max(overflow, 0):]
+    
+    @staticmethod
+    def _write_log_batch(batch: List[Dict[str, Any]]):
+        """Bulk insert a batch of search log rows"""
+        with get_db_context() as db:
+            # One executemany INSERT, like the collector's WorkMetadata inserts
+            db.execute(insert(SearchLog), batch)
+    
     def learn_from_selection(
         self,
         query: str,
@@ -584,7 +789,7 @@ class AISearchEngine:
     ):
         """Learn from user's result selection"""
         
-        work = db.query(WorkMetadata).filter(WorkMetadata.id == selected_work_id).first()
+        work = db.get(WorkMetadata, selected_work_id)
         if work:
             # Teach spell corrector
             self.spell_corrector.learn_from_search(query, work.title)
@@ -618,10 +823,17 @@ class AISearchEngine:
         except Exception as e:
             logger.error(f"Error recording feedback: {e}")
     
+    def warmup(self):
+        """Exercise the matchers once so the first search isn't cold"""
+        # Uncached encode: TF-IDF mode has nothing to warm and would keep the words
+        self.semantic_matcher.encode_uncached("warmup")
+        self.fuzzy_matcher.combined_score("warmup", "warm up")
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get search engine statistics"""
         return {
             'semantic_matcher': self.semantic_matcher.get_cache_stats(),
+            'response_cache_size': len(self._response_cache),
             'weights': {
                 'semantic': self.semantic_weight,
                 'fuzzy': self.fuzzy_weight,
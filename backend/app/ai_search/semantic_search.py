@@ -78,6 +78,17 @@ class SemanticMatcher:
         
         return embedding
     
+    @property
+    def uses_model(self) -> bool:
+        """True when a sentence-transformers model (not TF-IDF) is in use"""
+        return not self._use_simple_mode
+    
+    def encode_uncached(self, text: str) -> Optional[np.ndarray]:
+        """Model embedding that leaves shared caches untouched (None in TF-IDF mode)"""
+        if self._use_simple_mode or not text:
+            return None
+        return self._model.encode(normalize_title(text), convert_to_numpy=True)
+    
     def _compute_tfidf_vector(self, text: str) -> np.ndarray:
         """Compute TF-IDF vector for text (fallback mode)"""
         words = text.lower().split()
@@ -152,10 +163,13 @@ class SemanticMatcher:
         query: str, 
         candidates: List[Tuple[int, str]],  # (id, title) pairs
         top_k: int = 10,
-        min_similarity: float = None
+        min_similarity: float = None,
+        embeddings: Optional[List[Optional[np.ndarray]]] = None
     ) -> List[Tuple[int, str, float]]:
         """
         Find most similar candidates to query
+        `embeddings` optionally holds stored model embeddings aligned with candidates
+        (None where missing); the rest are computed
         Returns list of (id, title, similarity_score)
         """
         if not candidates:
@@ -163,15 +177,24 @@ class SemanticMatcher:
         
         min_sim = min_similarity or settings.MIN_SIMILARITY_THRESHOLD
         query_embedding = self.compute_embedding(query)
-        
-        # Compute similarities
-        results = []
-        for cand_id, title in candidates:
-            cand_embedding = self.compute_embedding(title)
-            similarity = self._cosine_similarity(query_embedding, cand_embedding)
-            
-            if similarity >= min_sim:
-                results.append((cand_id, title, similarity))
+        if embeddings is None:
+            embeddings = [None] * len(candidates)
+        
+        # One (N, D) matrix scored with a single matrix-vector product
+        matrix = np.stack([
+            stored if stored is not None and stored.shape == query_embedding.shape
+            else self.compute_embedding(title)
+            for (_, title), stored in zip(candidates, embeddings)
+        ])
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query_embedding)
+        dots = matrix @ query_embedding
+        similarities = np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
+        
+        results = [
+            (cand_id, title, float(similarity))
+            for (cand_id, title), similarity in zip(candidates, similarities)
+            if similarity >= min_sim
+        ]
         
         # Sort by similarity (descending)
         results.sort(key=lambda x: x[2], reverse=True)
@@ -0,0 +1,49 @@
+"""
+FastAPI Dependencies
+Service singletons are bound to app.state at startup and injected into routes
+"""
+
+from fastapi import Request
+
+from ..ai_search.search_engine import AISearchEngine
+from ..data_collection.collector import DataCollector
+from ..data_collection.scheduler import DataUpdateScheduler
+from ..ml_model.predictor import CopyrightPredictor
+from ..ml_model.trainer import IncrementalTrainer
+from ..rule_engine.rule_engine import CopyrightRuleEngine
+from ..rule_engine.smart_tag import SmartTagGenerator
+
+
+def search_engine_dep(request: Request) -> AISearchEngine:
+    """Search engine bound at startup"""
+    return request.app.state.search_engine
+
+
+def predictor_dep(request: Request) -> CopyrightPredictor:
+    """Copyright predictor bound at startup"""
+    return request.app.state.predictor
+
+
+def trainer_dep(request: Request) -> IncrementalTrainer:
+    """Incremental trainer bound at startup"""
+    return request.app.state.trainer
+
+
+def rule_engine_dep(request: Request) -> CopyrightRuleEngine:
+    """Rule engine bound at startup"""
+    return request.app.state.rule_engine
+
+
+def tag_generator_dep(request: Request) -> SmartTagGenerator:
+    """Smart tag generator bound at startup"""
+    return request.app.state.tag_generator
+
+
+def collector_dep(request: Request) -> DataCollector:
+    """Data collector bound at startup"""
+    return request.app.state.collector
+
+
+def scheduler_dep(request: Request) -> DataUpdateScheduler:
+    """Data update scheduler bound at startup"""
+    return request.app.state.scheduler
@@ -3,22 +3,29 @@ FastAPI Routes for SCET
 All API endpoints for search, analysis, and tag generation
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks, Request
+from fastapi.responses import HTMLResponse, StreamingResponse
+from sqlalchemy import select, func, text
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime
 import logging
+import time
+import asyncio
 
-from ..database.connection import get_db
+from ..database.connection import get_db, get_db_context
 from ..database.models import WorkMetadata, SearchLog
-from ..ai_search.search_engine import get_search_engine
-from ..data_collection.collector import get_collector
-from ..data_collection.scheduler import get_scheduler
-from ..ml_model.predictor import get_predictor
-from ..ml_model.trainer import get_trainer
-from ..rule_engine.rule_engine import get_rule_engine
-from ..rule_engine.smart_tag import get_tag_generator
+from ..ai_search.search_engine import AISearchEngine
+from ..data_collection.collector import DataCollector
+from ..data_collection.scheduler import DataUpdateScheduler
+from ..ml_model.predictor import CopyrightPredictor
+from ..ml_model.trainer import IncrementalTrainer
+from ..rule_engine.rule_engine import CopyrightRuleEngine
+from ..rule_engine.smart_tag import SmartTagGenerator
+from .dependencies import (
+    search_engine_dep, predictor_dep, trainer_dep, rule_engine_dep,
+    tag_generator_dep, collector_dep, scheduler_dep
+)
 from ..schemas import (
     SearchRequest, SearchResponse, SearchResult,
     CopyrightAnalysisRequest, CopyrightAnalysisResponse,
@@ -27,17 +34,48 @@ from ..schemas import (
     HealthCheck, ErrorResponse, AllowedUsage
 )
 from ..config import get_settings
+from ..utils import json_dumps_bytes
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Cached work counts for /works, keyed by content_type: (computed_at, count)
+_works_count_cache: Dict[Optional[str], Tuple[float, int]] = {}
+
+
+def _cached_works_count(db: Session, content_type: Optional[str]) -> int:
+    """Work count, recomputed at most every WORKS_COUNT_CACHE_SECONDS"""
+    now = time.monotonic()
+    cached = _works_count_cache.get(content_type)
+    if cached and now - cached[0] < settings.WORKS_COUNT_CACHE_SECONDS:
+        return cached[1]
+    
+    if content_type is None and db.bind.dialect.name == "postgresql":
+        # Planner estimate avoids a full scan on large tables
+        count = db.execute(text(
+            "SELECT reltuples::bigint FROM pg_class WHERE relname = :table"
+        ), {"table": WorkMetadata.__tablename__}).scalar() or 0
+    else:
+        query = db.query(func.count(WorkMetadata.id))
+        if content_type:
+            query = query.filter(WorkMetadata.content_type == content_type)
+        count = query.scalar()
+    
+    _works_count_cache[content_type] = (now, count)
+    return count
+
 
 # ============ Health & Status ============
 
 @router.get("/health", response_model=HealthCheck, tags=["System"])
-async def health_check(db: Session = Depends(get_db)):
+async def health_check(
+    request: Request,
+    db: Session = Depends(get_db),
+    predictor: CopyrightPredictor = Depends(predictor_dep),
+    collector: DataCollector = Depends(collector_dep)
+):
     """Check system health status"""
     try:
         # Check database
@@ -47,11 +85,9 @@ async def health_check(db: Session = Depends(get_db)):
         db_connected = False
     
     # Check ML model
-    predictor = get_predictor()
     ml_loaded = predictor.get_model_stats().get('feature_count', 0) > 0
     
     # Check data collection
-    collector = get_collector()
     collection_status = collector.get_status()
     
     return HealthCheck(
@@ -60,23 +96,26 @@ async def health_check(db: Session = Depends(get_db)):
         database_connected=db_connected,
         ml_models_loaded=ml_loaded,
         data_collection_active=collection_status.get('is_running', False),
-        timestamp=datetime.utcnow()
+        timestamp=request.state.now
     )
 
 
 @router.get("/stats", tags=["System"])
-async def get_system_stats(db: Session = Depends(get_db)):
+async def get_system_stats(
+    request: Request,
+    db: Session = Depends(get_db),
+    search_engine: AISearchEngine = Depends(search_engine_dep),
+    predictor: CopyrightPredictor = Depends(predictor_dep),
+    collector: DataCollector = Depends(collector_dep)
+):
     """Get system statistics"""
     work_count = db.query(WorkMetadata).count()
     search_count = db.query(SearchLog).count()
     
-    predictor = get_predictor()
     ml_stats = predictor.get_model_stats()
     
-    search_engine = get_search_engine()
     search_stats = search_engine.get_stats()
     
-    collector = get_collector()
     collection_stats = collector.get_status()
     
     return {
@@ -87,7 +126,7 @@ async def get_system_stats(db: Session = Depends(get_db)):
         "ml_model": ml_stats,
         "search_engine": search_stats,
         "data_collection": collection_stats,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": request.state.now.isoformat()
     }
 
 
@@ -97,7 +136,8 @@ async def get_system_stats(db: Session = Depends(get_db)):
 async def ai_search(
     request: SearchRequest,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    search_engine: AISearchEngine = Depends(search_engine_dep)
 ):
     """
     AI-powered title search
@@ -105,8 +145,6 @@ async def ai_search(
     - Returns semantically similar results
     - Collects new data from web if needed
     """
-    search_engine = get_search_engine()
-    
     try:
         response = await search_engine.search(
             query=request.query,
@@ -129,11 +167,10 @@ async def quick_search(
     q: str = Query(..., min_length=1, max_length=500, description="Search query"),
     type: Optional[str] = Query(None, description="Content type filter"),
     limit: int = Query(10, ge=1, le=50, description="Max results"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    search_engine: AISearchEngine = Depends(search_engine_dep)
 ):
     """Quick search endpoint with query parameters"""
-    search_engine = get_search_engine()
-    
     response = await search_engine.search(
         query=q,
         content_type=type,
@@ -149,15 +186,15 @@ async def quick_search(
 async def submit_search_feedback(
     feedback: TrainingFeedback,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    search_engine: AISearchEngine = Depends(search_engine_dep),
+    trainer: IncrementalTrainer = Depends(trainer_dep)
 ):
     """Submit feedback on search results for model improvement"""
-    search_engine = get_search_engine()
-    
-    # Record selection for learning
-    log = db.query(SearchLog).filter(SearchLog.id == feedback.search_id).first()
-    if log:
-        search_engine.learn_from_selection(log.query_text, feedback.selected_result_id, db)
+    # Record selection for learning; only the query text is needed, not the whole log row
+    query_text = db.scalar(select(SearchLog.query_text).where(SearchLog.id == feedback.search_id))
+    if query_text is not None:
+        search_engine.learn_from_selection(query_text, feedback.selected_result_id, db)
     
     # Update log with feedback
     search_engine.provide_feedback(
@@ -169,8 +206,7 @@ async def submit_search_feedback(
     
     # Queue for ML training
     if feedback.was_correct:
-        trainer = get_trainer()
-        work = db.query(WorkMetadata).filter(WorkMetadata.id == feedback.selected_result_id).first()
+        work = db.get(WorkMetadata, feedback.selected_result_id)
         if work and work.copyright_status:
             try:
                 status = CopyrightStatus(work.copyright_status)
@@ -194,7 +230,9 @@ async def submit_search_feedback(
 @router.post("/analyze", response_model=CopyrightAnalysisResponse, tags=["Analysis"])
 async def analyze_copyright(
     request: CopyrightAnalysisRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    predictor: CopyrightPredictor = Depends(predictor_dep),
+    rule_engine: CopyrightRuleEngine = Depends(rule_engine_dep)
 ):
     """
     Analyze copyright status for a work
@@ -202,7 +240,7 @@ async def analyze_copyright(
     """
     # If work_id provided, get from database
     if request.work_id:
-        work = db.query(WorkMetadata).filter(WorkMetadata.id == request.work_id).first()
+        work = db.get(WorkMetadata, request.work_id)
         if not work:
             raise HTTPException(status_code=404, detail="Work not found")
         
@@ -219,8 +257,8 @@ async def analyze_copyright(
         content_type = request.content_type.value if request.content_type else None
     
     # Get ML prediction
-    predictor = get_predictor()
-    ml_prediction = predictor.predict(
+    ml_prediction = await asyncio.to_thread(
+        predictor.predict,
         title=title,
         creator=creator,
         publication_year=publication_year,
@@ -230,8 +268,8 @@ async def analyze_copyright(
     )
     
     # Get rule-based analysis
-    rule_engine = get_rule_engine()
-    rule_analysis = rule_engine.analyze(
+    rule_analysis = await asyncio.to_thread(
+        rule_engine.analyze,
         title=title,
         creator=creator,
         publication_year=publication_year,
@@ -273,11 +311,13 @@ async def analyze_copyright(
 async def analyze_work_by_id(
     work_id: int,
     jurisdiction: str = Query("US", description="Jurisdiction for copyright rules"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    predictor: CopyrightPredictor = Depends(predictor_dep),
+    rule_engine: CopyrightRuleEngine = Depends(rule_engine_dep)
 ):
     """Analyze copyright for a specific work by ID"""
     request = CopyrightAnalysisRequest(work_id=work_id, jurisdiction=jurisdiction)
-    return await analyze_copyright(request, db)
+    return await analyze_copyright(request, db, predictor, rule_engine)
 
 
 # ============ Smart Tag Generation ============
@@ -285,14 +325,15 @@ async def analyze_work_by_id(
 @router.post("/tag", response_model=SmartTag, tags=["Smart Tag"])
 async def generate_smart_tag(
     request: SmartTagRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    search_engine: AISearchEngine = Depends(search_engine_dep),
+    tag_generator: SmartTagGenerator = Depends(tag_generator_dep)
 ):
     """
     Generate a Smart Copyright Expiry Tag
     The main output of the SCET system
     """
     # First, search for the work
-    search_engine = get_search_engine()
     search_result = await search_engine.search(
         query=request.query,
         content_type=request.content_type.value if request.content_type else None,
@@ -304,12 +345,11 @@ async def generate_smart_tag(
     # Get the best match
     if search_result.results:
         best = search_result.results[0]
-        work = db.query(WorkMetadata).filter(WorkMetadata.id == best.id).first()
+        work = db.get(WorkMetadata, best.id)
         
         if work:
-            tag_generator = get_tag_generator()
-            
-            return tag_generator.generate(
+            return await asyncio.to_thread(
+                tag_generator.generate,
                 title=work.title,
                 creator=work.creator,
                 publication_year=work.publication_year,
@@ -321,8 +361,8 @@ async def generate_smart_tag(
             )
     
     # No match found - generate tag from query alone
-    tag_generator = get_tag_generator()
-    return tag_generator.generate(
+    return await asyncio.to_thread(
+        tag_generator.generate,
         title=request.query,
         content_type=request.content_type.value if request.content_type else None,
         jurisdiction=request.jurisdiction,
@@ -336,15 +376,15 @@ async def generate_detailed_tag(
     creator: Optional[str] = Query(None, description="Creator/author"),
     year: Optional[int] = Query(None, description="Publication year"),
     type: Optional[str] = Query(None, description="Content type"),
-    jurisdiction: str = Query("US", description="Jurisdiction")
+    jurisdiction: str = Query("US", description="Jurisdiction"),
+    tag_generator: SmartTagGenerator = Depends(tag_generator_dep)
 ):
     """
     Generate a detailed Smart Tag with recommendations, risk assessment, and legal checklist
     Enhanced output for comprehensive copyright analysis
     """
-    tag_generator = get_tag_generator()
-    
-    result = tag_generator.generate_detailed_tag(
+    result = await asyncio.to_thread(
+        tag_generator.generate_detailed_tag,
         title=title,
         creator=creator,
         publication_year=year,
@@ -371,12 +411,12 @@ async def generate_html_tag(
     creator: Optional[str] = Query(None, description="Creator/author"),
     year: Optional[int] = Query(None, description="Publication year"),
     type: Optional[str] = Query(None, description="Content type"),
-    jurisdiction: str = Query("US", description="Jurisdiction")
+    jurisdiction: str = Query("US", description="Jurisdiction"),
+    tag_generator: SmartTagGenerator = Depends(tag_generator_dep)
 ):
     """Generate an HTML-formatted Smart Tag for embedding"""
-    tag_generator = get_tag_generator()
-    
-    html = tag_generator.generate_html_tag(
+    html = await asyncio.to_thread(
+        tag_generator.generate_html_tag,
         title=title,
         creator=creator,
         publication_year=year,
@@ -393,12 +433,12 @@ async def generate_compact_tag(
     creator: Optional[str] = Query(None, description="Creator/author"),
     year: Optional[int] = Query(None, description="Publication year"),
     type: Optional[str] = Query(None, description="Content type"),
-    jurisdiction: str = Query("US", description="Jurisdiction")
+    jurisdiction: str = Query("US", description="Jurisdiction"),
+    tag_generator: SmartTagGenerator = Depends(tag_generator_dep)
 ):
     """Generate a compact, single-line tag"""
-    tag_generator = get_tag_generator()
-    
-    compact = tag_generator.generate_compact_tag(
+    compact = await asyncio.to_thread(
+        tag_generator.generate_compact_tag,
         title=title,
         creator=creator,
         publication_year=year,
@@ -412,11 +452,11 @@ async def generate_compact_tag(
 # ============ Data Collection ============
 
 @router.get("/data/status", response_model=DataCollectionStatus, tags=["Data Collection"])
-async def get_collection_status():
+async def get_collection_status(
+    collector: DataCollector = Depends(collector_dep),
+    scheduler: DataUpdateScheduler = Depends(scheduler_dep)
+):
     """Get data collection status"""
-    collector = get_collector()
-    scheduler = get_scheduler()
-    
     collector_status = collector.get_status()
     scheduler_status = scheduler.get_status()
     
@@ -435,13 +475,16 @@ async def trigger_collection(
     query: str = Query(..., description="Query to collect data for"),
     content_type: Optional[str] = Query(None, description="Content type filter"),
     background_tasks: BackgroundTasks = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    collector: DataCollector = Depends(collector_dep),
+    search_engine: AISearchEngine = Depends(search_engine_dep)
 ):
     """Manually trigger data collection for a query"""
-    collector = get_collector()
-    
     collected = await collector.collect_for_query(query, content_type, db)
     
+    if collected:
+        search_engine.clear_response_cache()
+    
     return {
         "status": "collection_complete",
         "works_collected": len(collected),
@@ -452,11 +495,10 @@ async def trigger_collection(
 @router.post("/data/update/{work_id}", tags=["Data Collection"])
 async def update_work_data(
     work_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    scheduler: DataUpdateScheduler = Depends(scheduler_dep)
 ):
     """Force update data for a specific work"""
-    scheduler = get_scheduler()
-    
     success = await scheduler.force_update(work_id)
     
     if success:
@@ -468,11 +510,11 @@ async def update_work_data(
 # ============ ML Model ============
 
 @router.get("/ml/status", response_model=ModelStatus, tags=["ML Model"])
-async def get_model_status():
+async def get_model_status(
+    predictor: CopyrightPredictor = Depends(predictor_dep),
+    trainer: IncrementalTrainer = Depends(trainer_dep)
+):
     """Get ML model status"""
-    predictor = get_predictor()
-    trainer = get_trainer()
-    
     stats = predictor.get_model_stats()
     trainer_status = trainer.get_status()
     
@@ -489,10 +531,11 @@ async def get_model_status():
 
 
 @router.post("/ml/train", tags=["ML Model"])
-async def trigger_training(background_tasks: BackgroundTasks):
+async def trigger_training(
+    background_tasks: BackgroundTasks,
+    trainer: IncrementalTrainer = Depends(trainer_dep)
+):
     """Manually trigger model training"""
-    trainer = get_trainer()
-    
     # Run training in background
     background_tasks.add_task(trainer.run_training)
     
@@ -500,10 +543,11 @@ async def trigger_training(background_tasks: BackgroundTasks):
 
 
 @router.post("/ml/bootstrap", tags=["ML Model"])
-async def bootstrap_model(background_tasks: BackgroundTasks):
+async def bootstrap_model(
+    background_tasks: BackgroundTasks,
+    trainer: IncrementalTrainer = Depends(trainer_dep)
+):
     """Bootstrap model with rule-based training data"""
-    trainer = get_trainer()
-    
     # Run bootstrap in background
     background_tasks.add_task(trainer.bootstrap_model)
     
@@ -512,11 +556,10 @@ async def bootstrap_model(background_tasks: BackgroundTasks):
 
 @router.post("/ml/train-csv", tags=["ML Model"])
 async def train_from_csv(
-    csv_path: Optional[str] = Query(None, description="Path to CSV file. Uses default if not provided.")
+    csv_path: Optional[str] = Query(None, description="Path to CSV file. Uses default if not provided."),
+    trainer: IncrementalTrainer = Depends(trainer_dep)
 ):
     """Train model from CSV dataset file"""
-    trainer = get_trainer()
-    
     # Run training synchronously to return results
     result = await trainer.train_from_csv(csv_path)
     
@@ -538,34 +581,47 @@ async def list_works(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     content_type: Optional[str] = Query(None),
+    count: bool = Query(True, description="Include a (cached) total; false skips counting"),
     db: Session = Depends(get_db)
 ):
-    """List works in database"""
-    query = db.query(WorkMetadata)
+    """List works in database (streamed row by row)"""
+    total = _cached_works_count(db, content_type) if count else None
+    
+    stmt = select(
+        WorkMetadata.id,
+        WorkMetadata.title,
+        WorkMetadata.creator,
+        WorkMetadata.publication_year,
+        WorkMetadata.content_type,
+        WorkMetadata.copyright_status,
+        WorkMetadata.source_name
+    ).offset(skip).limit(limit)
     
     if content_type:
-        query = query.filter(WorkMetadata.content_type == content_type)
-    
-    total = query.count()
-    works = query.offset(skip).limit(limit).all()
-    
-    return {
-        "total": total,
-        "skip": skip,
-        "limit": limit,
-        "works": [
-            {
-                "id": w.id,
-                "title": w.title,
-                "creator": w.creator,
-                "publication_year": w.publication_year,
-                "content_type": w.content_type,
-                "copyright_status": w.copyright_status,
-                "source": w.source_name
-            }
-            for w in works
-        ]
-    }
+        stmt = stmt.where(WorkMetadata.content_type == content_type)
+    
+    def _generate():
+        # Own session: the request-scoped one is closed before the body streams
+        yield b'{"total":%s,"skip":%d,"limit":%d,"works":[' % (json_dumps_bytes(total), skip, limit)
+        with get_db_context() as stream_db:
+            rows = stream_db.execute(stmt.execution_options(stream_results=True, yield_per=100))
+            first = True
+            for w in rows:
+                if not first:
+                    yield b","
+                first = False
+                yield json_dumps_bytes({
+                    "id": w.id,
+                    "title": w.title,
+                    "creator": w.creator,
+                    "publication_year": w.publication_year,
+                    "content_type": w.content_type,
+                    "copyright_status": w.copyright_status,
+                    "source": w.source_name
+                })
+        yield b"]}"
+    
+    return StreamingResponse(_generate(), media_type="application/json")
 
 
 @router.get("/works/{work_id}", tags=["Works"])
@@ -574,7 +630,7 @@ async def get_work(
     db: Session = Depends(get_db)
 ):
     """Get a specific work by ID"""
-    work = db.query(WorkMetadata).filter(WorkMetadata.id == work_id).first()
+    work = db.get(WorkMetadata, work_id)
     
     if not work:
         raise HTTPException(status_code=404, detail="Work not found")
@@ -602,16 +658,19 @@ async def get_work(
 # ============ Jurisdictions ============
 
 @router.get("/jurisdictions", tags=["Jurisdictions"])
-async def list_jurisdictions():
+async def list_jurisdictions(
+    rule_engine: CopyrightRuleEngine = Depends(rule_engine_dep)
+):
     """List supported jurisdictions"""
-    rule_engine = get_rule_engine()
     return rule_engine.list_jurisdictions()
 
 
 @router.get("/jurisdictions/{code}", tags=["Jurisdictions"])
-async def get_jurisdiction(code: str):
+async def get_jurisdiction(
+    code: str,
+    rule_engine: CopyrightRuleEngine = Depends(rule_engine_dep)
+):
     """Get jurisdiction details"""
-    rule_engine = get_rule_engine()
     info = rule_engine.get_jurisdiction_info(code)
     
     if not info:
@@ -4,6 +4,7 @@ Contains all system configurations, API keys placeholders, and settings
 """
 
 import os
+import importlib.util
 from pathlib import Path
 from pydantic_settings import BaseSettings
 from typing import Optional, List
@@ -22,6 +23,9 @@ class Settings(BaseSettings):
     API_PREFIX: str = "/api/v1"
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    UVLOOP: bool = True  # Use uvloop + httptools when installed
+    # Each worker runs its own scheduler and singletons; keep at 1 with SQLite
+    WORKERS: int = 1
     
     # Database
     DATABASE_URL: str = "sqlite:///./scet_database.db"
@@ -32,11 +36,34 @@ class Settings(BaseSettings):
     EMBEDDING_MODEL: str = "sentence-transformers/all-MiniLM-L6-v2"
     MIN_SIMILARITY_THRESHOLD: float = 0.6
     FUZZY_MATCH_THRESHOLD: int = 70
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95  # Cosine similarity for a cache hit
+    SEMANTIC_CACHE_SIZE: int = 1024
+    SEMANTIC_CACHE_TTL_SECONDS: int = 300
+    
+    # Search logging (batching trades durability of recent logs for throughput)
+    LOG_BATCH_ENABLE: bool = False
+    LOG_BATCH_INTERVAL_MS: int = 100
+    LOG_BATCH_MAX_SIZE: int = 500
     
     # Data Collection Settings
     SCRAPING_DELAY: float = 1.0  # Delay between requests (be respectful)
     MAX_SEARCH_RESULTS: int = 20
+    WORKS_COUNT_CACHE_SECONDS: int = 30  # Staleness allowed for /works totals
     DATA_UPDATE_INTERVAL_HOURS: int = 24
+    SCHEDULER_CONCURRENCY: int = 16  # Stale entries re-verified in parallel
+    SCHEDULER_BATCH_SIZE: int = 500  # Stale entries per scheduler tick
+    COLLECT_CONCURRENCY: int = 20  # Queries scraped in parallel by batch_collect
+    SCRAPE_CACHE_TTL_SECONDS: int = 3600  # Re-verification scrapes reused for this long
+    SCRAPE_CACHE_SIZE: int = 10000
+    HTTP_POOL_LIMIT: int = 100  # Connections and in-flight requests for the shared scraper session
+    HTTP_POOL_LIMIT_PER_HOST: int = 8  # Also caps in-flight requests to any one host
+    SCRAPER_SEARCH_CACHE_TTL_SECONDS: int = 900  # Per-source search results reused for this long
+    SCRAPER_SEARCH_CACHE_SIZE: int = 4096
+    SCRAPER_MAX_RETRIES: int = 2  # Extra attempts on timeouts, connection errors, 429/5xx
+    SCRAPER_BACKOFF_BASE: float = 1.0  # Seconds; jittered, the upper bound doubles per retry
+    SCRAPER_BACKOFF_MAX: float = 10.0  # Also caps a server-sent Retry-After
+    SCRAPER_CIRCUIT_THRESHOLD: int = 5  # Consecutive failed fetches before a source is skipped
+    SCRAPER_CIRCUIT_OPEN_SECONDS: int = 60
     USER_AGENT: str = "SCET-Research-Bot/1.0 (Educational Research Project)"
     
     # Copyright Rules (Default: US-based, 70 years after author death)
@@ -51,6 +78,22 @@ class Settings(BaseSettings):
     RETRAIN_THRESHOLD: int = 100  # Retrain after N new entries
     MIN_CONFIDENCE_SCORE: float = 0.5
     
+    def ensure_dirs(self) -> None:
+        """Create model and data directories if they don't exist"""
+        self.MODEL_PATH.mkdir(parents=True, exist_ok=True)
+        self.DATA_PATH.mkdir(parents=True, exist_ok=True)
+    
+    def uvicorn_options(self) -> dict:
+        """Event loop, HTTP parser and worker options for uvicorn.run"""
+        use_uvloop = self.UVLOOP and importlib.util.find_spec("uvloop") is not None
+        use_httptools = self.UVLOOP and importlib.util.find_spec("httptools") is not None
+        return {
+            "loop": "uvloop" if use_uvloop else "asyncio",
+            "http": "httptools" if use_httptools else "h11",
+            # Reload mode runs a single process
+            "workers": None if self.DEBUG else self.WORKERS,
+        }
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -60,9 +103,3 @@ class Settings(BaseSettings):
 def get_settings() -> Settings:
     """Get cached settings instance"""
     return Settings()
-
-
-# Create models and data directories if not exists
-settings = get_settings()
-settings.MODEL_PATH.mkdir(parents=True, exist_ok=True)
-settings.DATA_PATH.mkdir(parents=True, exist_ok=True)
@@ -5,20 +5,51 @@ Stores only metadata - NO copyrighted content
 """
 
 import asyncio
+import io
 import logging
-from typing import Optional, List, Dict, Any
+import time
+from typing import Optional, List, Dict, Any, Set
 from datetime import datetime
+from sqlalchemy import insert, select, tuple_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from .scrapers import WebScraper, ScrapedWork
 from ..database.models import WorkMetadata, DataSource
-from ..database.connection import get_db_context
-from ..utils import normalize_title, calculate_text_hash
+from ..database.connection import (
+    get_db_context, get_async_db_context, async_db_available, upsert_supported, analyze_works
+)
+from ..utils import (
+    normalize_title, calculate_text_hash, chunk_list, similarity_ratio, embedding_to_blob
+)
 from ..config import get_settings
 
+try:
+    from rapidfuzz import process as rf_process
+    from rapidfuzz.distance import Levenshtein as RFLevenshtein
+except ImportError:  # Optional: falls back to the pure-Python similarity_ratio
+    rf_process = None
+
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Batches at least this large are ingested with COPY on PostgreSQL
+COPY_MIN_ROWS = 100
+
+# NULL marker for COPY; every other value is written quoted, so it cannot collide
+COPY_NULL = "\\N"
+
+# Keys per dedupe IN query (two bind parameters each, well under SQLite's limit)
+DEDUPE_LOOKUP_CHUNK = 500
+
+
+def _invalidate_search_cache():
+    """Drop cached search responses after stored works change"""
+    # Imported here: ai_search imports this package
+    from ..ai_search.search_engine import get_search_engine
+    get_search_engine().clear_response_cache()
+
 
 class DataCollector:
     """
@@ -29,20 +60,25 @@ class DataCollector:
     """
     
     def __init__(self):
+        settings.ensure_dirs()
         self.scraper = WebScraper()
         self._is_running = False
         self._last_run = None
         self._total_collected = 0
+        # (normalized title, content type, top_k) -> (expires_at, scraped works), oldest first
+        self._scrape_cache: Dict[tuple, tuple] = {}
     
     async def collect_for_query(
         self, 
         query: str, 
         content_type: Optional[str] = None,
-        db: Optional[Session] = None
+        db: Optional[Session] = None,
+        top_k: Optional[int] = None
     ) -> List[WorkMetadata]:
         """
         Collect data for a specific search query
         This is the primary method - triggered on-demand by user searches
+        top_k keeps only that many of the most confident scraped results
         """
         logger.info(f"Collecting data for query: '{query}' (type: {content_type})")
         
@@ -51,7 +87,7 @@ class DataCollector:
         
         try:
             # Scrape from all sources
-            scraped_works = await self.scraper.search_all(query, content_type)
+            scraped_works = await self.scraper.search_all(query, content_type, top_k=top_k)
             
             if not scraped_works:
                 logger.info(f"No results found for: {query}")
@@ -82,127 +118,464 @@ class DataCollector:
         db: Session
     ) -> List[WorkMetadata]:
         """Process scraped works and store as metadata"""
-        stored = []
+        return self._store_works(scraped_works, db)
+    
+    def _store_works(
+        self,
+        scraped_works: List[ScrapedWork],
+        db: Session
+    ) -> List[WorkMetadata]:
+        """Dedupe and write scraped works; synchronous so it can also run under AsyncSession.run_sync"""
+        if not scraped_works:
+            return []
         
+        # Group by dedupe key; the first work of a key wins, later ones merge in
+        grouped: Dict[tuple, List[ScrapedWork]] = {}
         for work in scraped_works:
-            try:
-                # Check for duplicates using normalized title
-                title_normalized = normalize_title(work.title)
-                
-                existing = db.query(WorkMetadata).filter(
-                    WorkMetadata.title_normalized == title_normalized,
-                    WorkMetadata.content_type == work.content_type
-                ).first()
-                
-                if existing:
-                    # Update existing record with new data if more confident
-                    if work.confidence > existing.data_confidence:
-                        existing = self._update_work(existing, work)
-                        stored.append(existing)
-                    continue
-                
-                # Create new metadata entry
-                metadata = WorkMetadata(
-                    title=work.title,
-                    title_normalized=title_normalized,
-                    creator=work.creator,
-                    creator_death_year=work.creator_death_year,
-                    publication_year=work.publication_year,
-                    content_type=work.content_type or "unknown",
-                    source_url=work.source_url,
-                    source_name=work.source_name,
-                    data_confidence=work.confidence,
-                    copyright_status="unknown",  # Will be calculated by rule engine
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow()
+            key = (normalize_title(work.title), work.content_type or "unknown")
+            grouped.setdefault(key, []).append(work)
+        
+        if upsert_supported():
+            return self._upsert_works(grouped, db)
+        
+        # One IN lookup per chunk of keys; only the columns needed to decide update-vs-skip
+        existing = {}
+        for keys in chunk_list(list(grouped), DEDUPE_LOOKUP_CHUNK):
+            for row in db.execute(
+                select(
+                    WorkMetadata.id,
+                    WorkMetadata.title_normalized,
+                    WorkMetadata.content_type,
+                    WorkMetadata.data_confidence
+                ).where(
+                    tuple_(WorkMetadata.title_normalized, WorkMetadata.content_type).in_(keys)
                 )
+            ):
+                existing[(row.title_normalized, row.content_type)] = row
+        
+        # Hydrate ORM objects only for rows that more confident data will update
+        update_ids = {
+            existing[key].id: key
+            for key, works in grouped.items()
+            if key in existing
+            and max(work.confidence for work in works) > existing[key].data_confidence
+        }
+        to_update = {}
+        for ids in chunk_list(list(update_ids), DEDUPE_LOOKUP_CHUNK):
+            for work in db.execute(
+                select(WorkMetadata).where(WorkMetadata.id.in_(ids))
+            ).scalars():
+                to_update[update_ids[work.id]] = work
+        
+        stored = []
+        new_rows = []
+        now = datetime.utcnow()
+        
+        for key, works in grouped.items():
+            if key in existing:
+                current = to_update.get(key)
+                if current is None:
+                    continue
                 
-                db.add(metadata)
-                db.flush()  # Get the ID
-                stored.append(metadata)
-                
-            except Exception as e:
-                logger.error(f"Error storing work {work.title}: {e}")
+                # Update existing record with new data if more confident
+                for work in works:
+                    if work.confidence > current.data_confidence:
+                        current = self._update_work(current, work, now)
+                stored.append(current)
                 continue
+            
+            new_rows.append(self._build_row(key, works, now))
+        
+        self._attach_title_embeddings(new_rows)
+        try:
+            if new_rows:
+                # Single multi-row INSERT (insertmanyvalues) returning ORM objects with IDs
+                inserted = db.scalars(
+                    insert(WorkMetadata).returning(WorkMetadata),
+                    new_rows
+                ).all()
+                stored.extend(inserted)
+            
+            db.commit()
+        except Exception as e:
+            logger.error(f"Error storing {len(new_rows)} works: {e}")
+            db.rollback()
+            return []
         
-        db.commit()
         return stored
     
-    def _update_work(self, existing: WorkMetadata, new_data: ScrapedWork) -> WorkMetadata:
-        """Update existing work with new data"""
+    def _upsert_works(
+        self,
+        grouped: Dict[tuple, List[ScrapedWork]],
+        db: Session
+    ) -> List[WorkMetadata]:
+        """Insert new works and merge into existing ones with one ON CONFLICT statement"""
+        now = datetime.utcnow()
+        rows = [self._build_row(key, works, now) for key, works in grouped.items()]
+        self._attach_title_embeddings(rows)
+        
+        dialect_insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+        stmt = dialect_insert(WorkMetadata)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['title_normalized', 'content_type'],
+            set_={
+                'creator': func.coalesce(WorkMetadata.creator, stmt.excluded.creator),
+                'creator_death_year': func.coalesce(
+                    WorkMetadata.creator_death_year, stmt.excluded.creator_death_year
+                ),
+                'publication_year': func.coalesce(
+                    WorkMetadata.publication_year, stmt.excluded.publication_year
+                ),
+                'data_confidence': stmt.excluded.data_confidence,
+                'title_embedding': func.coalesce(
+                    WorkMetadata.title_embedding, stmt.excluded.title_embedding
+                ),
+                'updated_at': stmt.excluded.updated_at,
+                'last_verified_at': stmt.excluded.updated_at,
+            },
+            # Only more confident data touches an existing row
+            where=stmt.excluded.data_confidence > WorkMetadata.data_confidence
+        )
+        
+        try:
+            # Rows skipped by the WHERE clause are not returned, like the update path
+            stored = db.scalars(
+                stmt.returning(WorkMetadata),
+                rows,
+                execution_options={'populate_existing': True}
+            ).all()
+            db.commit()
+        except Exception as e:
+            logger.error(f"Error upserting {len(rows)} works: {e}")
+            db.rollback()
+            return []
+        
+        return stored
+    
+    def _build_row(
+        self,
+        key: tuple,
+        works: List[ScrapedWork],
+        now: datetime
+    ) -> Dict[str, Any]:
+        """Insert row for one dedupe key, merging more confident duplicates"""
+        first = works[0]
+        row = {
+            'title': first.title,
+            'title_normalized': key[0],
+            'creator': first.creator,
+            'creator_death_year': first.creator_death_year,
+            'publication_year': first.publication_year,
+            'content_type': key[1],
+            'source_url': first.source_url,
+            'source_name': first.source_name,
+            'data_confidence': first.confidence,
+            'copyright_status': "unknown",  # Will be calculated by rule engine
+            'created_at': now,
+            'updated_at': now
+        }
+        for work in works[1:]:
+            if work.confidence > row['data_confidence']:
+                self._merge_row(row, work)
+        return row
+    
+    def _attach_title_embeddings(self, rows: List[Dict[str, Any]]):
+        """Store each new title's model embedding with its row; skipped in TF-IDF mode"""
+        # Imported here: ai_search imports this package
+        from ..ai_search.search_engine import get_search_engine
+        matcher = get_search_engine().semantic_matcher
+        if not rows or not matcher.uses_model:
+            return
+        
+        # One batched encode; also warms the cache used to score these works right after
+        embeddings = matcher.batch_compute_embeddings([row['title'] for row in rows])
+        for row in rows:
+            row['title_embedding'] = embedding_to_blob(embeddings[row['title']])
+    
+    async def _prepare_title_embeddings(self, works: List[ScrapedWork]):
+        """
+        Encode titles in a worker thread ahead of a batch store
+        The store (run_sync on the async engine) then only reads the embedding cache,
+        so the model encode does not block the event loop
+        """
+        # Imported here: ai_search imports this package
+        from ..ai_search.search_engine import get_search_engine
+        matcher = get_search_engine().semantic_matcher
+        if not works or not matcher.uses_model:
+            return
+        await asyncio.to_thread(matcher.batch_compute_embeddings, list({w.title for w in works}))
+    
+    def _merge_row(self, row: Dict[str, Any], new_data: ScrapedWork):
+        """Fill gaps in a pending insert row from a more confident duplicate"""
+        for field in ('creator', 'creator_death_year', 'publication_year'):
+            if getattr(new_data, field) and not row[field]:
+                row[field] = getattr(new_data, field)
+        row['data_confidence'] = new_data.confidence
+    
+    def _merge_fields(self, existing: Any, new_data: ScrapedWork) -> Dict[str, Any]:
+        """Column values new data would change on an existing work (ORM object or row)"""
+        fields = {}
+        
         # Update fields if new data is available
         if new_data.creator and not existing.creator:
-            existing.creator = new_data.creator
+            fields['creator'] = new_data.creator
         
         if new_data.creator_death_year and not existing.creator_death_year:
-            existing.creator_death_year = new_data.creator_death_year
+            fields['creator_death_year'] = new_data.creator_death_year
         
         if new_data.publication_year and not existing.publication_year:
-            existing.publication_year = new_data.publication_year
+            fields['publication_year'] = new_data.publication_year
         
         # Update confidence if higher
         if new_data.confidence > existing.data_confidence:
-            existing.data_confidence = new_data.confidence
+            fields['data_confidence'] = new_data.confidence
+        
+        return fields
+    
+    def _update_work(
+        self,
+        existing: WorkMetadata,
+        new_data: ScrapedWork,
+        now: Optional[datetime] = None
+    ) -> WorkMetadata:
+        """Update existing work with new data"""
+        now = now or datetime.utcnow()
         
-        existing.updated_at = datetime.utcnow()
-        existing.last_verified_at = datetime.utcnow()
+        for name, value in self._merge_fields(existing, new_data).items():
+            setattr(existing, name, value)
+        
+        existing.updated_at = now
+        existing.last_verified_at = now
         
         return existing
     
-    async def verify_and_update(self, work_id: int, db: Session) -> Optional[WorkMetadata]:
+    def _best_match(self, title: str, scraped: List[ScrapedWork]) -> Optional[ScrapedWork]:
+        """Scraped work whose title is at least 80% similar to the given one, best first"""
+        if not scraped:
+            return None
+        
+        if rf_process is not None:
+            # Same metric as similarity_ratio, scored in C over all candidates
+            match = rf_process.extractOne(
+                title,
+                [item.title for item in scraped],
+                scorer=RFLevenshtein.normalized_similarity,
+                processor=normalize_title,
+                score_cutoff=0.8
+            )
+            return scraped[match[2]] if match else None
+        
+        best_match = None
+        best_score = 0
+        for item in scraped:
+            title_sim = similarity_ratio(title, item.title)
+            if title_sim > best_score:
+                best_score = title_sim
+                best_match = item
+        
+        return best_match if best_score >= 0.8 else None
+    
+    async def verification_update(
+        self,
+        work: Any,
+        use_cache: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Re-scrape a stored work and return the column values to write, without touching the DB
+        None when no scraped result matches; timestamps are left to the caller
+        """
+        scraped = await self._search_cached(work.title, work.content_type, use_cache, top_k=1)
+        best_match = self._best_match(work.title, scraped)
+        if best_match is None:
+            return None
+        return self._merge_fields(work, best_match)
+    
+    async def verify_and_update(
+        self,
+        work_id: int,
+        db: Session,
+        use_cache: bool = True
+    ) -> Optional[WorkMetadata]:
         """
         Re-verify data for an existing work
         Used for periodic updates to keep data fresh
         """
-        work = db.query(WorkMetadata).filter(WorkMetadata.id == work_id).first()
+        # Primary-key lookup; served from the identity map when already loaded
+        work = db.get(WorkMetadata, work_id)
         if not work:
             return None
         
         # Re-search for this work
-        scraped = await self.scraper.search_all(work.title, work.content_type)
+        scraped = await self._search_cached(work.title, work.content_type, use_cache, top_k=1)
+        best_match = self._best_match(work.title, scraped)
         
-        if scraped:
-            # Find the best match
-            best_match = None
-            best_score = 0
-            
-            for item in scraped:
-                title_sim = self._title_similarity(work.title, item.title)
-                if title_sim > best_score:
-                    best_score = title_sim
-                    best_match = item
-            
-            if best_match and best_score > 0.8:
-                work = self._update_work(work, best_match)
-                work.last_verified_at = datetime.utcnow()
-                db.commit()
+        if best_match:
+            work = self._update_work(work, best_match)
+            db.commit()
         
         return work
     
-    def _title_similarity(self, title1: str, title2: str) -> float:
-        """Calculate title similarity"""
-        from ..utils import similarity_ratio
-        return similarity_ratio(title1, title2)
+    async def _search_cached(
+        self,
+        title: str,
+        content_type: Optional[str],
+        use_cache: bool = True,
+        top_k: Optional[int] = None
+    ) -> List[ScrapedWork]:
+        """Scrape for a title, reusing recent results for the same normalized title"""
+        key = (normalize_title(title), content_type, top_k)
+        now = time.monotonic()
+        
+        if use_cache:
+            cached = self._scrape_cache.get(key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+        
+        scraped = await self.scraper.search_all(
+            title, content_type, use_cache=use_cache, top_k=top_k
+        )
+        
+        # Empty results are not cached: a failed or timed-out scrape is retried next time
+        if scraped:
+            self._scrape_cache.pop(key, None)
+            self._scrape_cache[key] = (now + settings.SCRAPE_CACHE_TTL_SECONDS, scraped)
+            while len(self._scrape_cache) > settings.SCRAPE_CACHE_SIZE:
+                del self._scrape_cache[next(iter(self._scrape_cache))]
+        
+        return scraped
     
     async def batch_collect(
         self, 
         queries: List[str], 
         content_type: Optional[str] = None
     ) -> Dict[str, int]:
-        """Collect data for multiple queries"""
+        """Collect data for multiple queries, storing all results in one batch"""
         results = {}
+        scraped_by_query: Dict[str, List[ScrapedWork]] = {}
         
-        for query in queries:
-            try:
+        semaphore = asyncio.Semaphore(settings.COLLECT_CONCURRENCY)
+        
+        async def scrape(query: str):
+            async with semaphore:
+                try:
+                    scraped_by_query[query] = await self.scraper.search_all(query, content_type)
+                except Exception as e:
+                    logger.error(f"Error in batch collection for {query}: {e}")
+                    results[query] = 0
+        
+        self._is_running = True
+        try:
+            # Scraping is I/O bound, so queries run concurrently up to the limit
+            await asyncio.gather(*(scrape(query) for query in queries))
+            
+            all_works = [work for works in scraped_by_query.values() for work in works]
+            await self._prepare_title_embeddings(all_works)
+            if async_db_available():
+                # Driver I/O is awaited, so searches keep running while the batch is written
+                async with get_async_db_context() as db:
+                    stored_keys = await db.run_sync(
+                        lambda session: self._store_batch(all_works, session)
+                    )
+            else:
                 with get_db_context() as db:
-                    collected = await self.collect_for_query(query, content_type, db)
-                    results[query] = len(collected)
-            except Exception as e:
-                logger.error(f"Error in batch collection for {query}: {e}")
-                results[query] = 0
+                    stored_keys = self._store_batch(all_works, db)
+            
+            for query, works in scraped_by_query.items():
+                keys = {(normalize_title(w.title), w.content_type or "unknown") for w in works}
+                results[query] = len(keys & stored_keys)
+            
+            self._total_collected += len(stored_keys)
+            if stored_keys:
+                _invalidate_search_cache()
+            if len(stored_keys) >= COPY_MIN_ROWS:
+                # Keep planner statistics current after bulk loads
+                analyze_works()
+        finally:
+            self._is_running = False
+            self._last_run = datetime.utcnow()
         
         return results
     
+    def _store_batch(self, scraped_works: List[ScrapedWork], db: Session) -> Set[tuple]:
+        """Store a large batch, via COPY on PostgreSQL; returns the stored dedupe keys"""
+        if (
+            len(scraped_works) >= COPY_MIN_ROWS
+            and upsert_supported()
+            and db.bind.dialect.name == "postgresql"
+        ):
+            try:
+                return self._bulk_copy(scraped_works, db)
+            except Exception as e:
+                logger.warning(f"COPY ingest failed, falling back to INSERT: {e}")
+                db.rollback()
+        
+        stored = self._store_works(scraped_works, db)
+        return {(w.title_normalized, w.content_type) for w in stored}
+    
+    def _bulk_copy(self, scraped_works: List[ScrapedWork], db: Session) -> Set[tuple]:
+        """COPY rows into a temp table, then upsert them into work_metadata in one statement"""
+        grouped: Dict[tuple, List[ScrapedWork]] = {}
+        for work in scraped_works:
+            key = (normalize_title(work.title), work.content_type or "unknown")
+            grouped.setdefault(key, []).append(work)
+        now = datetime.utcnow()
+        rows = [self._build_row(key, works, now) for key, works in grouped.items()]
+        self._attach_title_embeddings(rows)
+        
+        columns = list(rows[0])
+        column_list = ", ".join(columns)
+        buf = io.StringIO()
+        for row in rows:
+            buf.write(",".join(self._copy_field(row[c]) for c in columns))
+            buf.write("\n")
+        buf.seek(0)
+        
+        raw = db.connection().connection
+        cursor = raw.cursor()
+        if not hasattr(cursor, "copy_expert"):
+            cursor.close()
+            raise RuntimeError("DB driver has no COPY support (psycopg2 required)")
+        
+        try:
+            cursor.execute(
+                "CREATE TEMP TABLE tmp_work_metadata "
+                "(LIKE work_metadata INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            cursor.copy_expert(
+                f"COPY tmp_work_metadata ({column_list}) FROM STDIN "
+                f"WITH (FORMAT csv, NULL '{COPY_NULL}')",
+                buf
+            )
+            cursor.execute(
+                f"INSERT INTO work_metadata ({column_list}) "
+                f"SELECT {column_list} FROM tmp_work_metadata "
+                "ON CONFLICT (title_normalized, content_type) DO UPDATE SET "
+                "creator = COALESCE(work_metadata.creator, EXCLUDED.creator), "
+                "creator_death_year = COALESCE(work_metadata.creator_death_year, EXCLUDED.creator_death_year), "
+                "publication_year = COALESCE(work_metadata.publication_year, EXCLUDED.publication_year), "
+                "data_confidence = EXCLUDED.data_confidence, "
+                "title_embedding = COALESCE(work_metadata.title_embedding, EXCLUDED.title_embedding), "
+                "updated_at = EXCLUDED.updated_at, "
+                "last_verified_at = EXCLUDED.updated_at "
+                "WHERE EXCLUDED.data_confidence > work_metadata.data_confidence "
+                "RETURNING title_normalized, content_type"
+            )
+            stored_keys = {tuple(r) for r in cursor.fetchall()}
+        finally:
+            cursor.close()
+        
+        db.commit()
+        return stored_keys
+    
+    @staticmethod
+    def _copy_field(value: Any) -> str:
+        """One quoted CSV field for COPY; None becomes the unquoted NULL marker"""
+        if value is None:
+            return COPY_NULL
+        if isinstance(value, bytes):
+            value = "\\x" + value.hex()  # bytea hex input format
+        return '"' + str(value).replace('"', '""') + '"'
+    
     def get_status(self) -> Dict[str, Any]:
         """Get current collection status"""
         return {
@@ -6,13 +6,14 @@ Handles periodic re-verification and updates of stored metadata
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Optional, List, Tuple, Dict
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from ..database.models import WorkMetadata
 from ..database.connection import get_db_context
 from ..config import get_settings
-from .collector import get_collector
+from .collector import get_collector, _invalidate_search_cache
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -31,6 +32,20 @@ class DataUpdateScheduler:
         self._running = False
         self._last_check = None
         self._entries_updated = 0
+        self._stale_cursor: Optional[Tuple[Optional[datetime], int]] = None
+    
+    @staticmethod
+    def _after_cursor(last_verified_at: Optional[datetime], work_id: int):
+        """Keyset predicate for rows ordered by (last_verified_at NULLS FIRST, id)"""
+        if last_verified_at is None:
+            return (
+                ((WorkMetadata.last_verified_at == None) & (WorkMetadata.id > work_id)) |
+                (WorkMetadata.last_verified_at != None)
+            )
+        return (
+            (WorkMetadata.last_verified_at > last_verified_at) |
+            ((WorkMetadata.last_verified_at == last_verified_at) & (WorkMetadata.id > work_id))
+        )
     
     async def start(self, interval_hours: Optional[int] = None):
         """Start the scheduler"""
@@ -77,31 +92,74 @@ class DataUpdateScheduler:
         threshold = datetime.utcnow() - timedelta(hours=settings.DATA_UPDATE_INTERVAL_HOURS * 7)
         
         with get_db_context() as db:
-            # Find entries that haven't been verified recently
-            stale_entries = db.query(WorkMetadata).filter(
+            # Stale entries after the saved cursor, oldest first; just the columns re-verification reads
+            query = db.query(
+                WorkMetadata.id,
+                WorkMetadata.last_verified_at,
+                WorkMetadata.title,
+                WorkMetadata.content_type,
+                WorkMetadata.creator,
+                WorkMetadata.creator_death_year,
+                WorkMetadata.publication_year,
+                WorkMetadata.data_confidence
+            ).filter(
                 (WorkMetadata.last_verified_at == None) | 
                 (WorkMetadata.last_verified_at < threshold)
-            ).limit(50).all()  # Process in batches
+            )
+            if self._stale_cursor is not None:
+                query = query.filter(self._after_cursor(*self._stale_cursor))
             
-            for entry in stale_entries:
+            stale = query.order_by(
+                WorkMetadata.last_verified_at.asc().nullsfirst(),
+                WorkMetadata.id.asc()
+            ).limit(settings.SCHEDULER_BATCH_SIZE).all()
+        
+        # Resume after this batch next tick; wrap around once the stale set is exhausted
+        if len(stale) == settings.SCHEDULER_BATCH_SIZE:
+            self._stale_cursor = (stale[-1].last_verified_at, stale[-1].id)
+        else:
+            self._stale_cursor = None
+        
+        # Bounded fan-out; each scraper still paces its own requests
+        updates: Dict[int, dict] = {}
+        pending = iter(stale)
+        
+        async def worker():
+            for work in pending:
                 try:
-                    await collector.verify_and_update(entry.id, db)
+                    fields = await collector.verification_update(work)
+                    if fields is not None:
+                        updates[work.id] = fields
                     self._entries_updated += 1
                 except Exception as e:
-                    logger.error(f"Error updating entry {entry.id}: {e}")
-                
-                # Rate limiting
-                await asyncio.sleep(1)
+                    logger.error(f"Error updating entry {work.id}: {e}")
+        
+        workers = min(settings.SCHEDULER_CONCURRENCY, len(stale))
+        await asyncio.gather(*(worker() for _ in range(workers)))
         
-        logger.info(f"Updated {len(stale_entries)} stale entries")
+        if updates:
+            # One executemany UPDATE by primary key and a single commit for the whole sweep
+            now = datetime.utcnow()
+            with get_db_context() as db:
+                db.execute(update(WorkMetadata), [
+                    {'id': work_id, **fields, 'updated_at': now, 'last_verified_at': now}
+                    for work_id, fields in updates.items()
+                ])
+            _invalidate_search_cache()
+        
+        logger.info(f"Updated {len(updates)} of {len(stale)} stale entries")
     
     async def force_update(self, work_id: int) -> bool:
         """Force update a specific work"""
         collector = get_collector()
         
         with get_db_context() as db:
-            result = await collector.verify_and_update(work_id, db)
-            return result is not None
+            # Forced updates always scrape fresh, refreshing the cached results
+            result = await collector.verify_and_update(work_id, db, use_cache=False)
+        
+        if result is not None:
+            _invalidate_search_cache()
+        return result is not None
     
     def get_status(self) -> dict:
         """Get scheduler status"""
@@ -5,23 +5,284 @@ Collects metadata dynamically from the internet - NO static datasets
 
 import asyncio
 import aiohttp
+import contextvars
+import functools
+import heapq
+import itertools
 import logging
+import random
+import sys
+import time
+from collections import OrderedDict
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterator, FrozenSet, Tuple
 from datetime import datetime
-from dataclasses import dataclass, field
-from bs4 import BeautifulSoup
-import json
+from dataclasses import dataclass, field, replace
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 import re
+from urllib.parse import urlparse, quote_plus
 
 from ..config import get_settings
-from ..utils import normalize_title, extract_year_from_text, clean_html, detect_content_type
+from ..utils import (
+    normalize_title, extract_year_from_text, clean_html, detect_content_type, json_loads
+)
+
+try:
+    import aiodns  # noqa: F401  (enables aiohttp's AsyncResolver)
+except ImportError:  # Optional: falls back to the threaded getaddrinfo resolver
+    aiodns = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional: E-Register pages are parsed with BeautifulSoup instead
+    LexborHTMLParser = None
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+
+# Shared endpoints queried by several scrapers
+WIKIPEDIA_API_URL = "https://en.wikipedia.org/w/api.php"
+SEMANTIC_SCHOLAR_SEARCH_URL = "https://api.semanticscholar.org/graph/v1/paper/search"
+DUCKDUCKGO_API_URL = "https://api.duckduckgo.com/"
+
+# Extra search terms that steer Wikipedia towards a content type
+_WIKI_TYPE_QUALIFIERS: Dict[str, str] = {
+    'book': 'novel book literature',
+    'music': 'song album music musician',
+    'film': 'film movie cinema',
+    'article': 'article paper',
+    'image': 'painting photograph artwork',
+    'patent': 'patent invention technology',
+    'software': 'software application programming',
+    'code': 'software library framework',
+    'trademark': 'trademark brand company',
+    'academic_paper': 'research paper academic study',
+}
+
+# Sources search_all queries for a content type; any other type queries every source
+_SOURCES_BY_TYPE: Dict[str, Tuple[str, ...]] = {
+    'book': ('openlib', 'wikipedia', 'indian_copyright'),
+    'music': ('musicbrainz', 'wikipedia', 'indian_copyright'),
+    'film': ('imdb', 'wikipedia', 'indian_copyright'),
+    'software': ('github', 'indian_copyright', 'innovation'),
+    'code': ('github', 'indian_copyright', 'innovation'),
+    'library': ('github', 'indian_copyright', 'innovation'),
+    'patent': ('patent', 'wikipedia', 'innovation'),
+    'trademark': ('trademark',),
+    'academic_paper': ('academic', 'research'),
+    'project': ('innovation', 'research', 'wikipedia', 'patent'),
+    'innovation': ('innovation', 'research', 'wikipedia', 'patent'),
+    'drone': ('innovation', 'research', 'wikipedia', 'patent'),
+    'technology': ('innovation', 'research', 'wikipedia', 'patent'),
+    'company': ('startup', 'wikipedia'),
+    'startup': ('startup', 'wikipedia'),
+    'research_project': ('research', 'innovation', 'academic'),
+}
+
+# Result content types search_all keeps for a requested content type (similar types grouped)
+_RESULT_TYPE_GROUPS: Dict[str, FrozenSet[str]] = {
+    content_type: frozenset(allowed) for content_type, allowed in {
+        'software': ['software', 'code', 'library'],
+        'code': ['software', 'code', 'library'],
+        'library': ['software', 'code', 'library'],
+        'book': ['book'],
+        'music': ['music'],
+        'film': ['film', 'movie'],
+        'patent': ['patent'],
+        'trademark': ['trademark'],
+        'academic_paper': ['academic_paper', 'article', 'research_paper'],
+        'project': ['project', 'innovation_project', 'research_project', 'product'],
+        'innovation': ['project', 'innovation_project', 'product', 'technology', 'innovation'],
+        'drone': ['project', 'innovation_project', 'product', 'technology', 'drone'],
+        'technology': ['project', 'innovation_project', 'product', 'technology'],
+        'company': ['company', 'startup_company'],
+        'startup': ['company', 'startup_company', 'startup'],
+        'research_project': ['research_project', 'academic_paper', 'project'],
+    }.items()
+}
+
+# "by Jane Doe" / "written by Jane Doe" / ... in Wikipedia extracts
+_CREATOR_RE = re.compile(r'(?:written |directed |composed )?by\s+([A-Z][a-z]+\s+[A-Z][a-z]+)')
+_YEAR_IN_PARENS = re.compile(r'\((\d{4})\)')
+_TRAILING_YEAR = re.compile(r'\s*\(\d{4}\)\s*$')
+_OG_TITLE_STRAINER = SoupStrainer('meta', attrs={'property': 'og:title'})
+_GRID_ROW_CLASS = re.compile(r'(GridView|row)', re.I)
+_WORD_RE = re.compile(r'\w+')
+_COMPANY_WORDS_RE = re.compile(r'company|startup|founded|corporation|inc\.|ltd', re.I)
+_HTML_FEED_CHUNK = 64 * 1024
+_ATOM_NS = {'atom': 'http://www.w3.org/2005/Atom'}
+_ATOM_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+_ROC_RE = re.compile(r'^[A-Z]-\d+')
+# One scan per cell for all category keywords, rather than a substring test per keyword
+_COPYRIGHT_CATEGORY_RE = re.compile(r'literary|artistic|musical|cinematograph|sound|software')
+
+
+def _rate_limit_pause(headers) -> Optional[float]:
+    """
+    Seconds a host asked us to hold off: Retry-After, or the X-RateLimit-Reset of an
+    exhausted quota (GitHub style); the HTTP-date form of Retry-After is ignored
+    """
+    try:
+        if headers.get('Retry-After'):
+            return max(float(headers['Retry-After']), 0.0)
+        if headers.get('X-RateLimit-Remaining') == '0' and headers.get('X-RateLimit-Reset'):
+            return max(float(headers['X-RateLimit-Reset']) - time.time(), 0.0)
+    except ValueError:
+        pass
+    return None
+
+
+class HostRateLimiter:
+    """
+    Spaces requests to one host at least `interval` seconds apart and caps how many are
+    in flight at once, shared by every caller
+    """
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_slot = 0.0
+        # Held for the whole request, outside its timeout, so queued requests don't time out
+        self.in_flight = asyncio.Semaphore(settings.HTTP_POOL_LIMIT_PER_HOST)
+    
+    def defer(self, seconds: float):
+        """Hold every caller off this host for `seconds`, e.g. after a 429"""
+        self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+    
+    async def wait(self):
+        # Reserve the next free slot synchronously, then sleep until it comes round
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+_host_limiters: Dict[str, HostRateLimiter] = {}
+
+
+def get_host_limiter(url: str, interval: float) -> HostRateLimiter:
+    """Limiter for the URL's host; the strictest interval any scraper asked for wins"""
+    host = urlparse(url).netloc
+    limiter = _host_limiters.get(host)
+    if limiter is None:
+        limiter = _host_limiters[host] = HostRateLimiter(interval)
+    elif interval > limiter.interval:
+        limiter.interval = interval
+    return limiter
+
+
+_shared_session: Optional[aiohttp.ClientSession] = None
+_request_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """Process-wide HTTP session so connections, TLS sessions and DNS lookups are reused across scrapers"""
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=settings.HTTP_POOL_LIMIT,
+            limit_per_host=settings.HTTP_POOL_LIMIT_PER_HOST,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+            resolver=aiohttp.AsyncResolver() if aiodns is not None else None
+        )
+        _shared_session = aiohttp.ClientSession(connector=connector)
+    return _shared_session
+
+
+def get_request_semaphore() -> asyncio.Semaphore:
+    """
+    Process-wide cap on in-flight scraper requests, sized to the connection pool
+    Acquired outside the request timeout, so queued requests don't time out waiting for a
+    connection; callers can gather freely and should not add their own outer semaphore
+    """
+    global _request_semaphore
+    if _request_semaphore is None:
+        _request_semaphore = asyncio.Semaphore(settings.HTTP_POOL_LIMIT)
+    return _request_semaphore
+
+
+async def close_shared_session():
+    """Close the shared HTTP session; the next request opens a new one"""
+    global _shared_session, _request_semaphore
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+    _request_semaphore = None
+
+
+# (source, normalized query, content type) -> (expires_at, results), least recently used first
+_search_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+# (url, params) -> (ETag, parsed JSON) for conditional GETs, least recently used first
+_etag_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+# Set for searches that must hit the network (forced re-verification); results are still stored
+_bypass_search_cache = contextvars.ContextVar("bypass_search_cache", default=False)
+# Searches currently running, keyed like _search_cache, so concurrent duplicates share one request
+_inflight_searches: Dict[tuple, "asyncio.Future"] = {}
+
+
+def _stamp_scraped_at(works: List[Optional["ScrapedWork"]]) -> None:
+    """Give every work from one fetch the same scrape time"""
+    now = datetime.utcnow()
+    for work in works:
+        if work is not None and work.scraped_at is None:
+            work.scraped_at = now
+
+
+def cached_search(func: Callable) -> Callable:
+    """Serve repeat searches for the same source and query from memory for a while"""
+    async def fetch_and_store(self, query: str, content_type: Optional[str], key: tuple) -> List["ScrapedWork"]:
+        results = await func(self, query, content_type)
+        _stamp_scraped_at(results)
+        
+        # Failed fetches come back as [], so only non-empty results are kept
+        if results:
+            expires = time.monotonic() + settings.SCRAPER_SEARCH_CACHE_TTL_SECONDS
+            _search_cache[key] = (expires, list(results))
+            while len(_search_cache) > settings.SCRAPER_SEARCH_CACHE_SIZE:
+                _search_cache.popitem(last=False)
+        return results
+    
+    @functools.wraps(func)
+    async def wrapper(self, query: str, content_type: Optional[str] = None) -> List["ScrapedWork"]:
+        key = (self.source_name, normalize_title(query), content_type or "")
+        bypass = _bypass_search_cache.get()
+        
+        if not bypass:
+            cached = _search_cache.get(key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    _search_cache.move_to_end(key)
+                    return list(cached[1])
+                del _search_cache[key]
+            
+            # Join an identical search that is already running instead of sending another
+            pending = _inflight_searches.get(key)
+            if pending is not None:
+                return list(await asyncio.shield(pending))
+        
+        task = asyncio.ensure_future(fetch_and_store(self, query, content_type, key))
+        if not bypass:
+            _inflight_searches[key] = task
+            task.add_done_callback(lambda _: _inflight_searches.pop(key, None))
+        
+        # Shielded so a cancelled caller doesn't cancel the search for callers that joined it
+        return list(await asyncio.shield(task))
+    
+    return wrapper
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep the __dict__ layout
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ScrapedWork:
     """Represents a work scraped from the web"""
     title: str
@@ -34,67 +295,140 @@ class ScrapedWork:
     description: Optional[str] = None
     additional_data: Dict[str, Any] = field(default_factory=dict)
     confidence: float = 0.7
-    scraped_at: datetime = field(default_factory=datetime.utcnow)
+    scraped_at: Optional[datetime] = None  # Stamped once per batch by the scraper, not per instance
+    
+    def __post_init__(self):
+        # Share one string object per source/type across large result sets
+        if self.source_name:
+            self.source_name = sys.intern(self.source_name)
+        if self.content_type:
+            self.content_type = sys.intern(self.content_type)
 
 
 class BaseScraper(ABC):
     """Abstract base class for all scrapers"""
     
+    # Content types this source can return; None when it detects the type per result
+    SUPPORTED_TYPES: Optional[FrozenSet[str]] = None
+    
     def __init__(self):
-        self.session: Optional[aiohttp.ClientSession] = None
         self.headers = {
             'User-Agent': settings.USER_AGENT,
             'Accept': 'application/json, text/html',
             'Accept-Language': 'en-US,en;q=0.9',
         }
         self.rate_limit_delay = settings.SCRAPING_DELAY
+        self._consecutive_failures = 0
+        self._circuit_open_until = 0.0
     
-    async def __aenter__(self):
-        self.session = aiohttp.ClientSession(headers=self.headers)
-        return self
+    @property
+    def circuit_open(self) -> bool:
+        """True while this source is skipped after repeated failures"""
+        return self._circuit_open_until > time.monotonic()
     
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+    def _record_success(self):
+        self._consecutive_failures = 0
     
-    async def fetch(self, url: str) -> Optional[str]:
-        """Fetch URL with rate limiting and error handling"""
-        if not self.session:
-            self.session = aiohttp.ClientSession(headers=self.headers)
-        
-        try:
-            await asyncio.sleep(self.rate_limit_delay)
-            
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                if response.status == 200:
-                    return await response.text()
-                else:
-                    logger.warning(f"HTTP {response.status} for {url}")
-                    return None
-        except asyncio.TimeoutError:
-            logger.error(f"Timeout fetching {url}")
-            return None
-        except Exception as e:
-            logger.error(f"Error fetching {url}: {e}")
-            return None
+    def _record_failure(self):
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= settings.SCRAPER_CIRCUIT_THRESHOLD:
+            self._circuit_open_until = time.monotonic() + settings.SCRAPER_CIRCUIT_OPEN_SECONDS
+            self._consecutive_failures = 0
+            logger.warning(
+                f"{self.__class__.__name__}: circuit open for "
+                f"{settings.SCRAPER_CIRCUIT_OPEN_SECONDS}s after repeated failures"
+            )
     
-    async def fetch_json(self, url: str) -> Optional[Dict]:
-        """Fetch JSON endpoint"""
-        if not self.session:
-            self.session = aiohttp.ClientSession(headers=self.headers)
+    async def _get(
+        self,
+        url: str,
+        as_json: bool = False,
+        params: Optional[Dict[str, Any]] = None,
+        conditional: bool = False
+    ) -> Any:
+        """GET with exponential back-off on transient failures and a per-source circuit breaker"""
+        if self.circuit_open:
+            return None
         
-        try:
-            await asyncio.sleep(self.rate_limit_delay)
+        session = get_shared_session()
+        headers = self.headers
+        etag_key = (url, tuple(sorted((params or {}).items())))
+        cached = _etag_cache.get(etag_key) if conditional else None
+        if cached is not None:
+            # Revalidate: an unchanged resource comes back as an empty 304
+            headers = {**self.headers, 'If-None-Match': cached[0]}
+        
+        limiter = get_host_limiter(url, self.rate_limit_delay)
+        host_paused = False
+        for attempt in range(settings.SCRAPER_MAX_RETRIES + 1):
+            # A host-sent pause is already on the limiter; otherwise back off with full jitter
+            # so scrapers that failed together don't retry in lockstep
+            if attempt and not host_paused:
+                delay = random.uniform(0, settings.SCRAPER_BACKOFF_BASE * 2 ** (attempt - 1))
+                await asyncio.sleep(min(delay, settings.SCRAPER_BACKOFF_MAX))
+            host_paused = False
             
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    logger.warning(f"HTTP {response.status} for {url}")
-                    return None
-        except Exception as e:
-            logger.error(f"Error fetching JSON {url}: {e}")
-            return None
+            try:
+                await limiter.wait()
+                
+                async with limiter.in_flight, get_request_semaphore(), session.get(
+                    url, params=params, headers=headers, timeout=aiohttp.ClientTimeout(total=30)
+                ) as response:
+                    pause = _rate_limit_pause(response.headers)
+                    host_paused = pause is not None
+                    if host_paused:
+                        limiter.defer(min(pause, settings.SCRAPER_BACKOFF_MAX))
+                    if response.status == 304 and cached is not None:
+                        self._record_success()
+                        _etag_cache.move_to_end(etag_key)
+                        return cached[1]
+                    if response.status == 200:
+                        self._record_success()
+                        if not as_json:
+                            return await response.text()
+                        # Parse the raw bytes: no str decode pass, and no Content-Type check
+                        # (some APIs label JSON as text/plain)
+                        data = json_loads(await response.read())
+                        etag = response.headers.get('ETag')
+                        if conditional and etag:
+                            _etag_cache[etag_key] = (etag, data)
+                            _etag_cache.move_to_end(etag_key)
+                            while len(_etag_cache) > settings.SCRAPER_SEARCH_CACHE_SIZE:
+                                _etag_cache.popitem(last=False)
+                        return data
+                    if response.status not in RETRY_STATUSES:
+                        logger.warning(f"HTTP {response.status} for {url}")
+                        return None
+                    error = f"HTTP {response.status}"
+            except asyncio.TimeoutError:
+                error = "timeout"
+            except aiohttp.ClientConnectorError as e:
+                # Unresolvable or refusing host: retrying right away only adds latency
+                error = str(e)
+                break
+            except aiohttp.ClientError as e:
+                error = str(e)
+            except Exception as e:
+                # Malformed payloads and the like will not improve on retry
+                logger.error(f"Error fetching {url}: {e}")
+                return None
+        
+        logger.error(f"Error fetching {url}: {error}")
+        self._record_failure()
+        return None
+    
+    async def fetch(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Fetch URL with rate limiting and error handling; params are URL-encoded by aiohttp"""
+        return await self._get(url, params=params)
+    
+    async def fetch_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        conditional: bool = False
+    ) -> Optional[Dict]:
+        """Fetch JSON endpoint; conditional revalidates a remembered ETag and reuses the parsed body on 304"""
+        return await self._get(url, as_json=True, params=params, conditional=conditional)
     
     @property
     @abstractmethod
@@ -111,6 +445,12 @@ class BaseScraper(ABC):
     async def get_details(self, identifier: str) -> Optional[ScrapedWork]:
         """Get detailed information about a specific work"""
         pass
+    
+    async def get_many_details(self, identifiers: List[str]) -> List[Optional[ScrapedWork]]:
+        """Get details for several works concurrently; the host limiter still paces requests"""
+        works = await asyncio.gather(*(self.get_details(i) for i in identifiers))
+        _stamp_scraped_at(works)
+        return works
 
 
 class OpenLibraryScraper(BaseScraper):
@@ -120,20 +460,20 @@ class OpenLibraryScraper(BaseScraper):
     """
     
     BASE_URL = "https://openlibrary.org"
+    SUPPORTED_TYPES = frozenset({'book'})
     
     @property
     def source_name(self) -> str:
         return "Open Library"
     
+    @cached_search
     async def search(self, query: str, content_type: Optional[str] = None) -> List[ScrapedWork]:
         """Search Open Library for books"""
         # Only search for books
         if content_type and content_type != "book":
             return []
         
-        search_url = f"{self.BASE_URL}/search.json?q={query}&limit=10"
-        
-        data = await self.fetch_json(search_url)
+        data = await self.fetch_json(f"{self.BASE_URL}/search.json", params={'q': query, 'limit': 10})
         if not data or 'docs' not in data:
             return []
         
@@ -171,14 +511,12 @@ class OpenLibraryScraper(BaseScraper):
         if not data:
             return None
         
-        # Get author details for death year
-        author_death_year = None
+        # Start the author lookup (for death year) before parsing the rest of the work
+        author_task = None
         if 'authors' in data and data['authors']:
             author_key = data['authors'][0].get('author', {}).get('key', '')
             if author_key:
-                author_data = await self.fetch_json(f"{self.BASE_URL}{author_key}.json")
-                if author_data and 'death_date' in author_data:
-                    author_death_year = extract_year_from_text(author_data['death_date'])
+                author_task = asyncio.create_task(self.fetch_json(f"{self.BASE_URL}{author_key}.json"))
         
         description = ""
         if 'description' in data:
@@ -187,6 +525,12 @@ class OpenLibraryScraper(BaseScraper):
             else:
                 description = str(data['description'])
         
+        author_death_year = None
+        if author_task is not None:
+            author_data = await author_task
+            if author_data and 'death_date' in author_data:
+                author_death_year = extract_year_from_text(author_data['death_date'])
+        
         return ScrapedWork(
             title=data.get('title', 'Unknown'),
             creator=data.get('by_statement'),
@@ -200,6 +544,48 @@ class OpenLibraryScraper(BaseScraper):
         )
 
 
+def _parse_wikipedia_results(items: List[Dict[str, Any]], content_type: Optional[str],
+                             source_name: str) -> List[ScrapedWork]:
+    """Build works from Wikipedia search hits, dropping ones whose detected type conflicts"""
+    results = []
+    for item in items:
+        try:
+            snippet = clean_html(item.get('snippet', ''))
+            detected_type = detect_content_type(snippet, item.get('title', ''))
+            
+            # If content_type is specified, ONLY return matching results
+            # Use the specified type, or skip if detection doesn't match
+            final_type = content_type if content_type else detected_type
+            
+            # Skip if user specified a type but detection found something different
+            if content_type and detected_type and detected_type != content_type:
+                # Only skip if detected type is clearly different
+                continue
+            
+            # Extract year from snippet
+            year = extract_year_from_text(snippet)
+            
+            work = ScrapedWork(
+                title=item.get('title', 'Unknown'),
+                publication_year=year,
+                content_type=final_type,
+                source_url=f"https://en.wikipedia.org/wiki/{item.get('title', '').replace(' ', '_')}",
+                source_name=source_name,
+                description=snippet[:300],
+                additional_data={
+                    'page_id': item.get('pageid'),
+                    'word_count': item.get('wordcount', 0),
+                },
+                confidence=0.75
+            )
+            results.append(work)
+        except Exception as e:
+            logger.error(f"Error parsing Wikipedia result: {e}")
+            continue
+    
+    return results
+
+
 class WikipediaScraper(BaseScraper):
     """
     Scraper for Wikipedia API
@@ -212,25 +598,12 @@ class WikipediaScraper(BaseScraper):
     def source_name(self) -> str:
         return "Wikipedia"
     
+    @cached_search
     async def search(self, query: str, content_type: Optional[str] = None) -> List[ScrapedWork]:
         """Search Wikipedia for works"""
         # Add content type to search if specified
-        search_query = query
-        if content_type:
-            type_qualifiers = {
-                'book': 'novel book literature',
-                'music': 'song album music musician',
-                'film': 'film movie cinema',
-                'article': 'article paper',
-                'image': 'painting photograph artwork',
-                'patent': 'patent invention technology',
-                'software': 'software application programming',
-                'code': 'software library framework',
-                'trademark': 'trademark brand company',
-                'academic_paper': 'research paper academic study',
-            }
-            if content_type in type_qualifiers:
-                search_query = f"{query} {type_qualifiers[content_type]}"
+        qualifier = _WIKI_TYPE_QUALIFIERS.get(content_type)
+        search_query = f"{query} {qualifier}" if qualifier else query
         
         params = {
             'action': 'query',
@@ -241,49 +614,14 @@ class WikipediaScraper(BaseScraper):
             'srprop': 'snippet|timestamp'
         }
         
-        url = f"{self.BASE_URL}?" + "&".join(f"{k}={v}" for k, v in params.items())
-        
-        data = await self.fetch_json(url)
+        data = await self.fetch_json(self.BASE_URL, params=params)
         if not data or 'query' not in data:
             return []
         
-        results = []
-        for item in data['query'].get('search', []):
-            try:
-                snippet = clean_html(item.get('snippet', ''))
-                detected_type = detect_content_type(snippet, item.get('title', ''))
-                
-                # If content_type is specified, ONLY return matching results
-                # Use the specified type, or skip if detection doesn't match
-                final_type = content_type if content_type else detected_type
-                
-                # Skip if user specified a type but detection found something different
-                if content_type and detected_type and detected_type != content_type:
-                    # Only skip if detected type is clearly different
-                    continue
-                
-                # Extract year from snippet
-                year = extract_year_from_text(snippet)
-                
-                work = ScrapedWork(
-                    title=item.get('title', 'Unknown'),
-                    publication_year=year,
-                    content_type=final_type,
-                    source_url=f"https://en.wikipedia.org/wiki/{item.get('title', '').replace(' ', '_')}",
-                    source_name=self.source_name,
-                    description=snippet[:300],
-                    additional_data={
-                        'page_id': item.get('pageid'),
-                        'word_count': item.get('wordcount', 0),
-                    },
-                    confidence=0.75
-                )
-                results.append(work)
-            except Exception as e:
-                logger.error(f"Error parsing Wikipedia result: {e}")
-                continue
-        
-        return results
+        # Snippet cleanup and type detection run off the loop so concurrent fetches keep moving
+        return await asyncio.to_thread(
+            _parse_wikipedia_results, data['query'].get('search', []), content_type, self.source_name
+        )
     
     async def get_details(self, page_title: str) -> Optional[ScrapedWork]:
         """Get detailed information from Wikipedia page"""
@@ -297,9 +635,7 @@ class WikipediaScraper(BaseScraper):
             'inprop': 'url'
         }
         
-        url = f"{self.BASE_URL}?" + "&".join(f"{k}={v}" for k, v in params.items())
-        
-        data = await self.fetch_json(url)
+        data = await self.fetch_json(self.BASE_URL, params=params)
         if not data or 'query' not in data:
             return None
         
@@ -314,19 +650,8 @@ class WikipediaScraper(BaseScraper):
         extract = page.get('extract', '')
         
         # Try to extract author/creator from text
-        creator = None
-        creator_patterns = [
-            r'by\s+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-            r'written by\s+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-            r'directed by\s+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-            r'composed by\s+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-        ]
-        
-        for pattern in creator_patterns:
-            match = re.search(pattern, extract)
-            if match:
-                creator = match.group(1)
-                break
+        match = _CREATOR_RE.search(extract)
+        creator = match.group(1) if match else None
         
         return ScrapedWork(
             title=page.get('title', 'Unknown'),
@@ -347,25 +672,30 @@ class MusicBrainzScraper(BaseScraper):
     """
     
     BASE_URL = "https://musicbrainz.org/ws/2"
+    SUPPORTED_TYPES = frozenset({'music'})
     
     def __init__(self):
         super().__init__()
         self.headers['Accept'] = 'application/json'
         self.rate_limit_delay = 1.1  # MusicBrainz requires 1 req/sec
+        # Artist death years never change, so each artist is looked up once per process
+        self._artist_death_years: Dict[str, Optional[int]] = {}
+        self._artist_lookups: Dict[str, asyncio.Task] = {}
     
     @property
     def source_name(self) -> str:
         return "MusicBrainz"
     
+    @cached_search
     async def search(self, query: str, content_type: Optional[str] = None) -> List[ScrapedWork]:
         """Search MusicBrainz for music works"""
         if content_type and content_type not in ['music', None]:
             return []
         
         # Search for recordings (songs)
-        url = f"{self.BASE_URL}/recording?query={query}&fmt=json&limit=10"
-        
-        data = await self.fetch_json(url)
+        data = await self.fetch_json(
+            f"{self.BASE_URL}/recording", params={'query': query, 'fmt': 'json', 'limit': 10}
+        )
         if not data or 'recordings' not in data:
             return []
         
@@ -414,25 +744,25 @@ class MusicBrainzScraper(BaseScraper):
         
         artist = None
         artist_death_year = None
+        artist_task = None
         
         if 'artist-credit' in data and data['artist-credit']:
             artist_info = data['artist-credit'][0]
             artist = artist_info.get('name')
             
-            # Try to get artist life span
+            # Start the artist life span lookup before parsing the release year
             artist_id = artist_info.get('artist', {}).get('id')
             if artist_id:
-                artist_data = await self.fetch_json(f"{self.BASE_URL}/artist/{artist_id}?fmt=json")
-                if artist_data and 'life-span' in artist_data:
-                    end_date = artist_data['life-span'].get('end')
-                    if end_date:
-                        artist_death_year = extract_year_from_text(end_date)
+                artist_task = asyncio.create_task(self._artist_death_year(artist_id))
         
         year = None
         if 'releases' in data and data['releases']:
             date_str = data['releases'][0].get('date', '')
             year = extract_year_from_text(date_str)
         
+        if artist_task is not None:
+            artist_death_year = await artist_task
+        
         return ScrapedWork(
             title=data.get('title', 'Unknown'),
             creator=artist,
@@ -445,6 +775,30 @@ class MusicBrainzScraper(BaseScraper):
         )
 
 
+    async def _artist_death_year(self, artist_id: str) -> Optional[int]:
+        """Artist's death year, fetched once per artist; concurrent callers share the request"""
+        if artist_id in self._artist_death_years:
+            return self._artist_death_years[artist_id]
+        
+        task = self._artist_lookups.get(artist_id)
+        if task is None:
+            task = asyncio.ensure_future(self.fetch_json(f"{self.BASE_URL}/artist/{artist_id}?fmt=json"))
+            self._artist_lookups[artist_id] = task
+            task.add_done_callback(lambda _: self._artist_lookups.pop(artist_id, None))
+        
+        # Shielded so one cancelled caller doesn't cancel the lookup for the others
+        artist_data = await asyncio.shield(task)
+        if not artist_data:
+            return None  # Failed fetch: not remembered, the next call retries
+        
+        death_year = None
+        end_date = (artist_data.get('life-span') or {}).get('end')
+        if end_date:
+            death_year = extract_year_from_text(end_date)
+        self._artist_death_years[artist_id] = death_year
+        return death_year
+
+
 class IMDbScraper(BaseScraper):
     """
     Scraper for film information using public web pages
@@ -452,12 +806,14 @@ class IMDbScraper(BaseScraper):
     """
     
     BASE_URL = "https://www.imdb.com"
+    SUPPORTED_TYPES = frozenset({'film'})
     SEARCH_URL = "https://v2.sg.media-imdb.com/suggestion"
     
     @property
     def source_name(self) -> str:
         return "IMDb"
     
+    @cached_search
     async def search(self, query: str, content_type: Optional[str] = None) -> List[ScrapedWork]:
         """Search for films/shows"""
         if content_type and content_type not in ['film', None]:
@@ -467,7 +823,7 @@ class IMDbScraper(BaseScraper):
         first_letter = query[0].lower() if query else 'a'
         url = f"{self.SEARCH_URL}/{first_letter}/{query.replace(' ', '_')}.json"
         
-        data = await self.fetch_json(url)
+        data = await self.fetch_json(url, conditional=True)
         if not data or 'd' not in data:
             return []
         
@@ -510,17 +866,18 @@ class IMDbScraper(BaseScraper):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'html.parser')
+        # Only the og:title meta tag is needed, so skip building the rest of the tree
+        soup = BeautifulSoup(html, 'lxml', parse_only=_OG_TITLE_STRAINER)
         
         # Extract basic info from meta tags and structured data
         title = soup.find('meta', property='og:title')
         title_text = title.get('content', 'Unknown') if title else 'Unknown'
         
         # Clean title (remove year in parentheses)
-        title_text = re.sub(r'\s*\(\d{4}\)\s*$', '', title_text)
+        title_text = _TRAILING_YEAR.sub('', title_text)
         
         year = None
-        year_match = re.search(r'\((\d{4})\)', str(soup))
+        year_match = _YEAR_IN_PARENS.search(html)
         if year_match:
             year = int(year_match.group(1))
         
@@ -540,21 +897,24 @@ class GitHubScraper(BaseScraper):
     Checks open source licenses
     """
     BASE_URL = "https://api.github.com"
+    SUPPORTED_TYPES = frozenset({'software'})
     
     @property
     def source_name(self) -> str:
         return "GitHub"
     
+    @cached_search
     async def search(self, query: str, content_type: Optional[str] = None) -> List[ScrapedWork]:
         """Search GitHub repositories"""
-        url = f"{self.BASE_URL}/search/repositories?q={query}&sort=stars&per_page=10"
+        params = {'q': query, 'sort': 'stars', 'per_page': 10}
         
         try:
-            html = await self.fetch(url)
-            if not html:
+            data = await self.fetch_json(
+                f"{self.BASE_URL}/search/repositories", params=params, conditional=True
+            )
+            if not data:
                 return []
             
-            data = json.loads(html)
             results = []
             
             for item in data.get('items', [])[:10]:
@@ -598,11 +958,10 @@ class GitHubScraper(BaseScraper):
         url = f"{self.BASE_URL}/repos/{repo_name}"
         
         try:
-            html = await self.fetch(url)
-            if not html:
+            item = await self.fetch_json(url)
+            if not item:
                 return None
             
-            item = json.loads(html)
             license_info = item.get('license') or {}
             license_name = license_info.get('spdx_id') or license_info.get('name') or 'Unknown'
             created_at = item.get('created_at', '')
@@ -637,11 +996,13 @@ class PatentScraper(BaseScraper):
     Scraper for Patents - Uses USPTO/EPO public APIs
     """
     BASE_URL = "https://api.patentsview.org/patents/query"
+    SUPPORTED_TYPES = frozenset({'patent'})
     
     @property
     def source_name(self) -> str:
         return "USPTO Patent Database"
     
+    @cached_search
     async def search(self, query: str, content_type: Optional[str] = None) -> List[ScrapedWork]:
         """Search patents"""
         # PatentsView API query
@@ -654,22 +1015,22 @@ class PatentScraper(BaseScraper):
         }
         
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession(headers=self.headers)
-            
-            await asyncio.sleep(self.rate_limit_delay)
+            limiter = get_host_limiter(self.BASE_URL, self.rate_limit_delay)
+            await limiter.wait()
             
-            async with self.session.post(
+            async with limiter.in_flight, get_request_semaphore(), get_shared_session().post(
                 self.BASE_URL, 
                 json=payload,
+                headers=self.headers,
                 timeout=aiohttp.ClientTimeout(total=30)
             ) as response:
                 if response.status != 200:
                     logger.warning(f"Patent API returned {response.status}")
                     return []
                 
-                data = await response.json()
+                data = json_loads(await response.read())
                 results = []
+                current_year = datetime.now().year
                 
                 for patent in data.get('patents', [])[:10]:
                     # Extract year from date
@@ -682,7 +1043,7 @@ class PatentScraper(BaseScraper):
                     
                     # Calculate patent status (20 years from filing)
                     status = 'active'
-                    if year and (datetime.now().year - year) > 20:
+                    if year and (current_year - year) > 20:
                         status = 'expired'
                     
                     work = ScrapedWork(
@@ -714,9 +1075,8 @@ class PatentScraper(BaseScraper):
         """Fallback to Wikipedia for patent information"""
         wiki = WikipediaScraper()
         results = await wiki.search(f"{query} patent invention", 'patent')
-        for r in results:
-            r.content_type = 'patent'
-        return results
+        # Copies: the Wikipedia works are shared with its search cache
+        return [replace(r, content_type='patent') for r in results]
     
     async def get_details(self, identifier: str) -> Optional[ScrapedWork]:
         """Get detailed patent info"""
@@ -728,11 +1088,13 @@ class TrademarkScraper(BaseScraper):
     Scraper for Trademarks - Uses public trademark databases
     """
     BASE_URL = "https://tmsearch.uspto.gov"
+    SUPPORTED_TYPES = frozenset({'trademark'})
     
     @property
     def source_name(self) -> str:
         return "USPTO Trademark Database"
     
+    @cached_search
     async def search(self, query: str, content_type: Optional[str] = None) -> List[ScrapedWork]:
         """Search trademarks - uses Wikipedia as proxy since direct API is complex"""
         # USPTO TESS doesn't have a public API, so we use Wikipedia
@@ -740,18 +1102,21 @@ class TrademarkScraper(BaseScraper):
         wiki_results = await wiki.search(f"{query} trademark brand", None)
         
         results = []
+        query_lower = query.lower()
         for r in wiki_results:
             # Check if it mentions trademark in description
             desc = (r.description or '').lower()
             title_lower = r.title.lower()
             
             if 'trademark' in desc or 'brand' in desc or 'logo' in desc:
-                r.content_type = 'trademark'
-                r.additional_data['ip_type'] = 'trademark'
-                r.additional_data['ip_status'] = 'registered' if 'registered' in desc else 'unknown'
-                r.additional_data['renewable'] = True  # Trademarks can be renewed indefinitely
-                results.append(r)
-            elif query.lower() in title_lower:
+                # Copy rather than edit: the Wikipedia work is shared with its search cache
+                results.append(replace(r, content_type='trademark', additional_data={
+                    **r.additional_data,
+                    'ip_type': 'trademark',
+                    'ip_status': 'registered' if 'registered' in desc else 'unknown',
+                    'renewable': True,  # Trademarks can be renewed indefinitely
+                }))
+            elif query_lower in title_lower:
                 # Assume it could be a trademark
                 work = ScrapedWork(
                     title=r.title,
@@ -783,21 +1148,22 @@ class AcademicScraper(BaseScraper):
     Scraper for Academic Papers - Uses OpenAlex/Semantic Scholar
     """
     BASE_URL = "https://api.openalex.org"
+    SUPPORTED_TYPES = frozenset({'academic_paper'})
     
     @property
     def source_name(self) -> str:
         return "OpenAlex Academic Database"
     
+    @cached_search
     async def search(self, query: str, content_type: Optional[str] = None) -> List[ScrapedWork]:
         """Search academic papers"""
-        url = f"{self.BASE_URL}/works?search={query}&per-page=10"
+        params = {'search': query, 'per-page': 10}
         
         try:
-            html = await self.fetch(url)
-            if not html:
+            data = await self.fetch_json(f"{self.BASE_URL}/works", params=params)
+            if not data:
                 return []
             
-            data = json.loads(html)
             results = []
             
             for item in data.get('results', [])[:10]:
@@ -842,6 +1208,87 @@ class AcademicScraper(BaseScraper):
         return None
 
 
+def _page_may_mention(html: str, query: str) -> bool:
+    """
+    Cheap check before parsing a page: every word of the query occurs somewhere in the raw
+    HTML. Words rather than the whole phrase, since tags and whitespace can split a phrase
+    """
+    html_lower = html.lower()
+    return all(word in html_lower for word in _WORD_RE.findall(query.lower()))
+
+
+def _table_row_texts(html: str) -> Iterator[List[str]]:
+    """
+    Cleaned cell texts of every table row, skipping each table's header row
+    Lazy, so a caller that has enough matches can stop before the rest of the page is parsed
+    """
+    if LexborHTMLParser is not None:
+        for table in LexborHTMLParser(html).css('table'):
+            for row in table.css('tr')[1:]:
+                yield [clean_html(cell.text()) for cell in row.css('td, th')]
+        return
+    
+    # Feed lxml the page in chunks and free each row once read, so the full tree is never built
+    parser = etree.HTMLPullParser(events=('start', 'end'), tag=('table', 'tr'))
+    
+    def events():
+        for offset in range(0, len(html), _HTML_FEED_CHUNK):
+            parser.feed(html[offset:offset + _HTML_FEED_CHUNK])
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+    
+    open_tables = []  # rows started so far in each open table, innermost last
+    skip_rows = []  # per open row: header row, or not inside a table
+    for event, element in events():
+        if element.tag == 'table':
+            if event == 'start':
+                open_tables.append(0)
+            elif open_tables:
+                open_tables.pop()
+        elif event == 'start':
+            skip_rows.append(not open_tables or open_tables[-1] == 0)
+            if open_tables:
+                open_tables[-1] += 1
+        else:
+            if not (skip_rows.pop() if skip_rows else True):
+                yield [clean_html(''.join(cell.itertext())) for cell in element.iter('td', 'th')]
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+
+def _classify_register_cells(cell_texts: List[str]) -> tuple:
+    """
+    One pass over an E-Register row's cells -> (title, author, category, roc_number)
+    The title is the longest meaningful text; a title it displaces becomes the author
+    """
+    title = author = category = roc_number = None
+    title_len = 0
+    for text in cell_texts:
+        text_lower = text.lower()
+        if 'roc' in text_lower or _ROC_RE.match(text):
+            roc_number = text
+        elif _COPYRIGHT_CATEGORY_RE.search(text_lower):
+            category = text
+        elif len(text) > max(title_len, 10) and not text.isdigit():
+            author, title, title_len = title, text, len(text)
+    return title, author, category, roc_number
+
+
+def _grid_entry_texts(html: str, limit: int) -> List[tuple]:
+    """(text, raw <td> texts) for the first grid rows/divs on an ASP.NET listing page"""
+    if LexborHTMLParser is not None:
+        entries = [
+            node for node in LexborHTMLParser(html).css('tr, div')
+            if _GRID_ROW_CLASS.search(node.attributes.get('class') or '')
+        ]
+        return [(node.text(), [cell.text() for cell in node.css('td')]) for node in entries[:limit]]
+    
+    entries = BeautifulSoup(html, 'lxml').find_all(['tr', 'div'], class_=_GRID_ROW_CLASS)
+    return [(entry.get_text(), [cell.get_text() for cell in entry.find_all('td')]) for entry in entries[:limit]]
+
+
 class IndianCopyrightScraper(BaseScraper):
     """
     Scraper for Indian Copyright Office (copyright.gov.in)
@@ -859,26 +1306,33 @@ class IndianCopyrightScraper(BaseScraper):
         "https://copyright.gov.in/ERegister_2021.aspx",
         "https://copyright.gov.in/ERegister_2020.aspx",
     ]
+    MAX_RESULTS = 10
     
     @property
     def source_name(self) -> str:
         return "Indian Copyright Office"
     
+    @cached_search
     async def search(self, query: str, content_type: Optional[str] = None) -> List[ScrapedWork]:
         """Search Indian Copyright Office database"""
         results = []
         query_lower = query.lower()
+        # Lowercased titles already kept; duplicates are dropped before a ScrapedWork is built
+        seen_titles = set()
         
         try:
-            # Method 1: Search E-Register pages (most reliable)
-            for register_url in self.E_REGISTER_URLS[:3]:  # Check last 3 years
+            # Method 1: Search E-Register pages (most reliable), last 3 years fetched together
+            register_urls = self.E_REGISTER_URLS[:3]
+            pages = await asyncio.gather(*(self.fetch(url) for url in register_urls), return_exceptions=True)
+            for register_url, html in zip(register_urls, pages):
                 try:
-                    html = await self.fetch(register_url)
+                    if isinstance(html, Exception):
+                        raise html
                     if html:
-                        register_results = await self._parse_e_register(html, query_lower, content_type, register_url)
+                        register_results = await self._parse_e_register(
+                            html, query_lower, content_type, register_url, seen_titles
+                        )
                         results.extend(register_results)
-                        if len(results) >= 10:
-                            break
                 except Exception as e:
                     logger.warning(f"Error fetching E-Register {register_url}: {e}")
                     continue
@@ -886,118 +1340,98 @@ class IndianCopyrightScraper(BaseScraper):
             # Method 2: Try the search form
             if len(results) < 5:
                 try:
-                    search_results = await self._search_via_form(query, content_type)
+                    search_results = await self._search_via_form(query, content_type, seen_titles)
                     results.extend(search_results)
                 except Exception as e:
                     logger.warning(f"Error with form search: {e}")
             
             # Method 3: Fallback to Wikipedia for Indian works
             if len(results) < 3:
-                fallback_results = await self._search_fallback(query, content_type)
-                results.extend(fallback_results)
-            
-            # Remove duplicates by title
-            seen_titles = set()
-            unique_results = []
-            for r in results:
-                if r.title.lower() not in seen_titles:
-                    seen_titles.add(r.title.lower())
-                    unique_results.append(r)
+                for r in await self._search_fallback(query, content_type):
+                    title_key = r.title.lower()
+                    if title_key not in seen_titles:
+                        seen_titles.add(title_key)
+                        results.append(r)
             
-            return unique_results[:10]
+            return results[:self.MAX_RESULTS]
             
         except Exception as e:
             logger.error(f"Indian Copyright search error: {e}")
             return await self._search_fallback(query, content_type)
     
-    async def _parse_e_register(self, html: str, query: str, content_type: Optional[str], source_url: str) -> List[ScrapedWork]:
+    async def _parse_e_register(
+        self,
+        html: str,
+        query: str,
+        content_type: Optional[str],
+        source_url: str,
+        seen_titles: set
+    ) -> List[ScrapedWork]:
         """Parse E-Register page for registered works"""
         results = []
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Find the main table with registrations
-        tables = soup.find_all('table')
+        if not _page_may_mention(html, query):
+            return results
         
-        for table in tables:
-            rows = table.find_all('tr')
-            
-            for row in rows[1:]:  # Skip header row
-                try:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) < 3:
-                        continue
-                    
-                    # Extract data from cells
-                    # Typical columns: ROC No, Diary No, Title, Category, Author/Applicant
-                    cell_texts = [clean_html(cell.get_text()) for cell in cells]
-                    
-                    # Find title (usually longest text or in a specific column)
-                    title = None
-                    author = None
-                    category = None
-                    roc_number = None
-                    
-                    for i, text in enumerate(cell_texts):
-                        text_lower = text.lower()
-                        # ROC number pattern
-                        if 'roc' in text_lower or re.match(r'^[A-Z]-\d+', text):
-                            roc_number = text
-                        # Category detection
-                        elif any(cat in text_lower for cat in ['literary', 'artistic', 'musical', 'cinematograph', 'sound', 'software']):
-                            category = text
-                        # Title is usually the longest meaningful text
-                        elif len(text) > 10 and not text.isdigit():
-                            if title is None or len(text) > len(title):
-                                if title:
-                                    author = title  # Previous title becomes author
-                                title = text
-                    
-                    if not title:
-                        continue
-                    
-                    # Check if query matches
-                    if query not in title.lower():
-                        continue
-                    
-                    # Detect content type from category
-                    detected_type = self._detect_type_from_category(category) if category else content_type
-                    
-                    # Extract year from ROC number or URL
-                    year = None
-                    if '2025' in source_url:
-                        year = 2025
-                    elif '2024' in source_url:
-                        year = 2024
-                    elif '2023' in source_url:
-                        year = 2023
-                    elif '2022' in source_url:
-                        year = 2022
-                    
-                    work = ScrapedWork(
-                        title=title[:200],
-                        creator=author[:100] if author else None,
-                        publication_year=year,
-                        content_type=detected_type or 'book',
-                        source_url=source_url,
-                        source_name=self.source_name,
-                        description=f"Registered with Indian Copyright Office. ROC: {roc_number}" if roc_number else "Registered with Indian Copyright Office",
-                        additional_data={
-                            'jurisdiction': 'IN',
-                            'registration_country': 'India',
-                            'copyright_registered': True,
-                            'roc_number': roc_number,
-                            'category': category
-                        },
-                        confidence=0.9
-                    )
-                    results.append(work)
-                    
-                except Exception as e:
+        # Typical columns: ROC No, Diary No, Title, Category, Author/Applicant
+        for cell_texts in _table_row_texts(html):
+            try:
+                if len(cell_texts) < 3:
                     continue
+                
+                title, author, category, roc_number = _classify_register_cells(cell_texts)
+                if not title:
+                    continue
+                
+                # Check if query matches, and skip titles an earlier row or page already gave
+                if query not in title.lower():
+                    continue
+                title = title[:200]
+                title_key = title.lower()
+                if title_key in seen_titles:
+                    continue
+                seen_titles.add(title_key)
+                
+                # Detect content type from category
+                detected_type = self._detect_type_from_category(category) if category else content_type
+                
+                # Extract year from ROC number or URL
+                year = None
+                if '2025' in source_url:
+                    year = 2025
+                elif '2024' in source_url:
+                    year = 2024
+                elif '2023' in source_url:
+                    year = 2023
+                elif '2022' in source_url:
+                    year = 2022
+                
+                work = ScrapedWork(
+                    title=title,
+                    creator=author[:100] if author else None,
+                    publication_year=year,
+                    content_type=detected_type or 'book',
+                    source_url=source_url,
+                    source_name=self.source_name,
+                    description=f"Registered with Indian Copyright Office. ROC: {roc_number}" if roc_number else "Registered with Indian Copyright Office",
+                    additional_data={
+                        'jurisdiction': 'IN',
+                        'registration_country': 'India',
+                        'copyright_registered': True,
+                        'roc_number': roc_number,
+                        'category': category
+                    },
+                    confidence=0.9
+                )
+                results.append(work)
+                if len(results) >= self.MAX_RESULTS:
+                    break  # search keeps no more than this; leave the rest of the page unparsed
+            
+            except Exception as e:
+                continue
         
         return results
     
-    async def _search_via_form(self, query: str, content_type: Optional[str]) -> List[ScrapedWork]:
+    async def _search_via_form(self, query: str, content_type: Optional[str], seen_titles: set) -> List[ScrapedWork]:
         """Search using the search form with title parameter"""
         results = []
         
@@ -1007,24 +1441,22 @@ class IndianCopyrightScraper(BaseScraper):
         
         try:
             html = await self.fetch(fresh_url)
-            if html:
-                soup = BeautifulSoup(html, 'html.parser')
-                
+            if html and _page_may_mention(html, query):
+                query_lower = query.lower()
                 # Look for application entries
-                entries = soup.find_all(['tr', 'div'], class_=re.compile(r'(GridView|row)', re.I))
-                
-                for entry in entries[:20]:
+                for text, cells in _grid_entry_texts(html, limit=20):
                     try:
-                        text = entry.get_text()
-                        if query.lower() in text.lower():
+                        if query_lower in text.lower():
                             # Extract title
-                            cells = entry.find_all('td')
                             if cells and len(cells) >= 2:
-                                title = clean_html(cells[1].get_text()) if len(cells) > 1 else clean_html(cells[0].get_text())
+                                title = clean_html(cells[1]) if len(cells) > 1 else clean_html(cells[0])
                                 
-                                if title and len(title) > 3:
+                                title = title[:200]
+                                title_key = title.lower()
+                                if title and len(title) > 3 and title_key not in seen_titles:
+                                    seen_titles.add(title_key)
                                     work = ScrapedWork(
-                                        title=title[:200],
+                                        title=title,
                                         content_type=content_type or 'book',
                                         source_url=fresh_url,
                                         source_name=self.source_name,
@@ -1070,17 +1502,24 @@ class IndianCopyrightScraper(BaseScraper):
         results = []
         
         # Search Wikipedia for Indian copyright-related works
-        wiki_url = f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={query}+india&format=json&srlimit=5"
+        wiki_params = {
+            'action': 'query',
+            'list': 'search',
+            'srsearch': f"{query} india",
+            'format': 'json',
+            'srlimit': 5
+        }
         
         try:
-            data = await self.fetch_json(wiki_url)
+            data = await self.fetch_json(WIKIPEDIA_API_URL, params=wiki_params)
             if data and 'query' in data:
+                query_lower = query.lower()
                 for item in data['query'].get('search', [])[:5]:
                     title = item.get('title', '')
                     snippet = clean_html(item.get('snippet', ''))
                     
                     # Only include if query matches
-                    if query.lower() not in title.lower() and query.lower() not in snippet.lower():
+                    if query_lower not in title.lower() and query_lower not in snippet.lower():
                         continue
                     
                     work = ScrapedWork(
@@ -1113,36 +1552,38 @@ class InnovationProjectScraper(BaseScraper):
     Sources: Product Hunt, Crunchbase (via news), Google Scholar
     """
     
+    SUPPORTED_TYPES = frozenset({'project', 'research_project', 'product'})
+    
     @property
     def source_name(self) -> str:
         return "Innovation & Projects"
     
+    @cached_search
     async def search(self, query: str, content_type: Optional[str] = None) -> List[ScrapedWork]:
         """Search for innovation projects, drones, disaster management, etc."""
-        results = []
-        
-        # Search Wikipedia for technology/innovation projects
-        wiki_results = await self._search_wikipedia(query)
-        results.extend(wiki_results)
-        
-        # Search for academic/research projects
-        research_results = await self._search_research_projects(query)
-        results.extend(research_results)
-        
-        # Search for startup/product projects
-        product_results = await self._search_products(query)
-        results.extend(product_results)
-        
-        return results[:10]
+        # Wikipedia tech projects, research projects and startup products are independent
+        # lookups (each handles its own errors), so they run together
+        groups = await asyncio.gather(
+            self._search_wikipedia(query),
+            self._search_research_projects(query),
+            self._search_products(query)
+        )
+        return list(itertools.islice(itertools.chain.from_iterable(groups), 10))
     
     async def _search_wikipedia(self, query: str) -> List[ScrapedWork]:
         """Search Wikipedia for innovation/tech projects"""
         results = []
         
-        wiki_url = f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={query}+technology+project&format=json&srlimit=5"
+        wiki_params = {
+            'action': 'query',
+            'list': 'search',
+            'srsearch': f"{query} technology project",
+            'format': 'json',
+            'srlimit': 5
+        }
         
         try:
-            data = await self.fetch_json(wiki_url)
+            data = await self.fetch_json(WIKIPEDIA_API_URL, params=wiki_params)
             if data and 'query' in data:
                 for item in data['query'].get('search', [])[:5]:
                     title = item.get('title', '')
@@ -1172,10 +1613,10 @@ class InnovationProjectScraper(BaseScraper):
         results = []
         
         # Use Semantic Scholar API for research projects
-        api_url = f"https://api.semanticscholar.org/graph/v1/paper/search?query={query}+project&limit=5&fields=title,year,authors,abstract"
+        api_params = {'query': f"{query} project", 'limit': 5, 'fields': 'title,year,authors,abstract'}
         
         try:
-            data = await self.fetch_json(api_url)
+            data = await self.fetch_json(SEMANTIC_SCHOLAR_SEARCH_URL, params=api_params)
             if data and 'data' in data:
                 for paper in data['data'][:5]:
                     title = paper.get('title', '')
@@ -1189,7 +1630,7 @@ class InnovationProjectScraper(BaseScraper):
                         creator=author_names if author_names else None,
                         publication_year=year,
                         content_type='research_project',
-                        source_url=f"https://www.semanticscholar.org/search?q={query}",
+                        source_url=f"https://www.semanticscholar.org/search?q={quote_plus(query)}",
                         source_name="Semantic Scholar - Research",
                         description=abstract[:300] if abstract else None,
                         additional_data={
@@ -1209,10 +1650,10 @@ class InnovationProjectScraper(BaseScraper):
         results = []
         
         # Use DuckDuckGo instant answers for products/startups
-        ddg_url = f"https://api.duckduckgo.com/?q={query}+startup+product&format=json&no_html=1"
+        ddg_params = {'q': f"{query} startup product", 'format': 'json', 'no_html': 1}
         
         try:
-            data = await self.fetch_json(ddg_url)
+            data = await self.fetch_json(DUCKDUCKGO_API_URL, params=ddg_params)
             if data:
                 # Check abstract
                 if data.get('Abstract'):
@@ -1259,36 +1700,46 @@ class StartupCompanyScraper(BaseScraper):
     Scraper for startups and companies
     """
     
+    SUPPORTED_TYPES = frozenset({'company'})
+    
     @property
     def source_name(self) -> str:
         return "Startups & Companies"
     
+    @cached_search
     async def search(self, query: str, content_type: Optional[str] = None) -> List[ScrapedWork]:
         """Search for startups and companies"""
         results = []
         
         # Search Wikipedia for companies
-        wiki_url = f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={query}+company+startup&format=json&srlimit=5"
+        wiki_params = {
+            'action': 'query',
+            'list': 'search',
+            'srsearch': f"{query} company startup",
+            'format': 'json',
+            'srlimit': 5
+        }
         
         try:
-            data = await self.fetch_json(wiki_url)
+            data = await self.fetch_json(WIKIPEDIA_API_URL, params=wiki_params)
             if data and 'query' in data:
                 for item in data['query'].get('search', [])[:5]:
                     title = item.get('title', '')
                     snippet = clean_html(item.get('snippet', ''))
                     
                     # Check if it's actually a company
-                    if any(word in snippet.lower() for word in ['company', 'startup', 'founded', 'corporation', 'inc.', 'ltd']):
+                    if _COMPANY_WORDS_RE.search(snippet):
+                        year = extract_year_from_text(snippet)
                         work = ScrapedWork(
                             title=title,
-                            publication_year=extract_year_from_text(snippet),
+                            publication_year=year,
                             content_type='company',
                             source_url=f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}",
                             source_name="Wikipedia - Companies",
                             description=snippet[:300] if snippet else None,
                             additional_data={
                                 'category': 'startup_company',
-                                'founded_year': extract_year_from_text(snippet)
+                                'founded_year': year
                             },
                             confidence=0.7
                         )
@@ -1297,10 +1748,10 @@ class StartupCompanyScraper(BaseScraper):
             logger.error(f"Company search error: {e}")
         
         # Also search DuckDuckGo
-        ddg_url = f"https://api.duckduckgo.com/?q={query}+company&format=json&no_html=1"
+        ddg_params = {'q': f"{query} company", 'format': 'json', 'no_html': 1}
         
         try:
-            data = await self.fetch_json(ddg_url)
+            data = await self.fetch_json(DUCKDUCKGO_API_URL, params=ddg_params)
             if data and data.get('Abstract'):
                 work = ScrapedWork(
                     title=data.get('Heading', query),
@@ -1330,32 +1781,30 @@ class ResearchDatabaseScraper(BaseScraper):
     Sources: Semantic Scholar, arXiv, PubMed
     """
     
+    SUPPORTED_TYPES = frozenset({'academic_paper'})
+    
     @property
     def source_name(self) -> str:
         return "Research Database"
     
+    @cached_search
     async def search(self, query: str, content_type: Optional[str] = None) -> List[ScrapedWork]:
         """Search academic research databases"""
-        results = []
-        
-        # Search Semantic Scholar
-        ss_results = await self._search_semantic_scholar(query)
-        results.extend(ss_results)
-        
-        # Search arXiv
-        arxiv_results = await self._search_arxiv(query)
-        results.extend(arxiv_results)
-        
-        return results[:10]
+        # Semantic Scholar and arXiv are independent (each handles its own errors)
+        groups = await asyncio.gather(
+            self._search_semantic_scholar(query),
+            self._search_arxiv(query)
+        )
+        return list(itertools.islice(itertools.chain.from_iterable(groups), 10))
     
     async def _search_semantic_scholar(self, query: str) -> List[ScrapedWork]:
         """Search Semantic Scholar"""
         results = []
         
-        api_url = f"https://api.semanticscholar.org/graph/v1/paper/search?query={query}&limit=5&fields=title,year,authors,abstract,citationCount"
+        api_params = {'query': query, 'limit': 5, 'fields': 'title,year,authors,abstract,citationCount'}
         
         try:
-            data = await self.fetch_json(api_url)
+            data = await self.fetch_json(SEMANTIC_SCHOLAR_SEARCH_URL, params=api_params)
             if data and 'data' in data:
                 for paper in data['data'][:5]:
                     title = paper.get('title', '')
@@ -1370,7 +1819,7 @@ class ResearchDatabaseScraper(BaseScraper):
                         creator=author_names if author_names else None,
                         publication_year=year,
                         content_type='academic_paper',
-                        source_url=f"https://www.semanticscholar.org/search?q={query}",
+                        source_url=f"https://www.semanticscholar.org/search?q={quote_plus(query)}",
                         source_name="Semantic Scholar",
                         description=abstract[:300] if abstract else None,
                         additional_data={
@@ -1389,32 +1838,25 @@ class ResearchDatabaseScraper(BaseScraper):
         """Search arXiv preprints"""
         results = []
         
-        arxiv_url = f"http://export.arxiv.org/api/query?search_query=all:{query}&start=0&max_results=5"
+        arxiv_params = {'search_query': f"all:{query}", 'start': 0, 'max_results': 5}
         
         try:
-            xml_data = await self.fetch(arxiv_url)
+            xml_data = await self.fetch("http://export.arxiv.org/api/query", params=arxiv_params)
             if xml_data:
-                # Parse XML response
-                soup = BeautifulSoup(xml_data, 'xml')
-                entries = soup.find_all('entry')
+                # Parse the Atom feed with lxml directly; no BeautifulSoup wrapper tree needed
+                root = etree.fromstring(xml_data.encode('utf-8'), _ATOM_PARSER)
                 
-                for entry in entries[:5]:
-                    title = entry.find('title')
-                    title = clean_html(title.get_text()) if title else ''
+                for entry in root.findall('atom:entry', _ATOM_NS)[:5]:
+                    title = clean_html(entry.findtext('atom:title', '', _ATOM_NS))
+                    summary = clean_html(entry.findtext('atom:summary', '', _ATOM_NS))[:300]
                     
-                    summary = entry.find('summary')
-                    summary = clean_html(summary.get_text())[:300] if summary else ''
+                    names = [a.findtext('atom:name', None, _ATOM_NS) for a in entry.findall('atom:author', _ATOM_NS)[:3]]
+                    author_names = ', '.join(name for name in names if name is not None)
                     
-                    authors = entry.find_all('author')
-                    author_names = ', '.join([a.find('name').get_text() for a in authors[:3] if a.find('name')])
+                    published = entry.findtext('atom:published', None, _ATOM_NS)
+                    year = extract_year_from_text(published) if published else None
                     
-                    published = entry.find('published')
-                    year = None
-                    if published:
-                        year = extract_year_from_text(published.get_text())
-                    
-                    link = entry.find('id')
-                    url = link.get_text() if link else ''
+                    url = entry.findtext('atom:id', '', _ATOM_NS)
                     
                     work = ScrapedWork(
                         title=title,
@@ -1461,84 +1903,64 @@ class WebScraper:
             'research': ResearchDatabaseScraper(),
         }
     
-    async def search_all(self, query: str, content_type: Optional[str] = None) -> List[ScrapedWork]:
-        """Search across all sources and merge results"""
-        all_results = []
-        
+    async def search_all(
+        self,
+        query: str,
+        content_type: Optional[str] = None,
+        use_cache: bool = True,
+        top_k: Optional[int] = None
+    ) -> List[ScrapedWork]:
+        """
+        Search across all sources and merge results, most confident first
+        With top_k, only that many results are selected rather than sorting them all
+        """
         # Select appropriate scrapers based on content type
-        if content_type == 'book':
-            scrapers_to_use = ['openlib', 'wikipedia', 'indian_copyright']
-        elif content_type == 'music':
-            scrapers_to_use = ['musicbrainz', 'wikipedia', 'indian_copyright']
-        elif content_type == 'film':
-            scrapers_to_use = ['imdb', 'wikipedia', 'indian_copyright']
-        elif content_type in ['software', 'code', 'library']:
-            scrapers_to_use = ['github', 'indian_copyright', 'innovation']
-        elif content_type == 'patent':
-            scrapers_to_use = ['patent', 'wikipedia', 'innovation']
-        elif content_type == 'trademark':
-            scrapers_to_use = ['trademark']
-        elif content_type == 'academic_paper':
-            scrapers_to_use = ['academic', 'research']
-        elif content_type in ['project', 'innovation', 'drone', 'technology']:
-            scrapers_to_use = ['innovation', 'research', 'wikipedia', 'patent']
-        elif content_type in ['company', 'startup']:
-            scrapers_to_use = ['startup', 'wikipedia']
-        elif content_type == 'research_project':
-            scrapers_to_use = ['research', 'innovation', 'academic']
-        else:
-            scrapers_to_use = list(self.scrapers.keys())
+        scrapers_to_use = _SOURCES_BY_TYPE.get(content_type) or self.scrapers
+        allowed_types = None
+        if content_type:
+            allowed_types = _RESULT_TYPE_GROUPS.get(content_type) or frozenset((content_type,))
         
-        # Run searches concurrently
+        # Run searches concurrently, skipping sources whose circuit is open and sources
+        # whose results would all be filtered out below
         tasks = []
         for scraper_name in scrapers_to_use:
             scraper = self.scrapers[scraper_name]
+            if scraper.circuit_open:
+                continue
+            if (
+                allowed_types is not None
+                and scraper.SUPPORTED_TYPES is not None
+                and scraper.SUPPORTED_TYPES.isdisjoint(allowed_types)
+            ):
+                continue
             tasks.append(scraper.search(query, content_type))
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Tasks created by gather copy the current context, bypass flag included
+        token = _bypass_search_cache.set(not use_cache)
+        try:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            _bypass_search_cache.reset(token)
         
         for result in results:
-            if isinstance(result, Exception):
+            if isinstance(result, BaseException):
                 logger.error(f"Scraper error: {result}")
-                continue
-            if result:
-                all_results.extend(result)
+        all_results = list(itertools.chain.from_iterable(
+            result for result in results if not isinstance(result, BaseException) and result
+        ))
         
         # STRICT FILTERING: If content_type is specified, filter to only include matching types
-        if content_type:
-            # Map similar types together
-            type_groups = {
-                'software': ['software', 'code', 'library'],
-                'code': ['software', 'code', 'library'],
-                'library': ['software', 'code', 'library'],
-                'book': ['book'],
-                'music': ['music'],
-                'film': ['film', 'movie'],
-                'patent': ['patent'],
-                'trademark': ['trademark'],
-                'academic_paper': ['academic_paper', 'article', 'research_paper'],
-                'project': ['project', 'innovation_project', 'research_project', 'product'],
-                'innovation': ['project', 'innovation_project', 'product', 'technology'],
-                'drone': ['project', 'innovation_project', 'product', 'technology', 'drone'],
-                'technology': ['project', 'innovation_project', 'product', 'technology'],
-                'company': ['company', 'startup_company'],
-                'startup': ['company', 'startup_company'],
-                'research_project': ['research_project', 'academic_paper', 'project'],
-            }
-            allowed_types = type_groups.get(content_type, [content_type])
-            all_results = [
-                r for r in all_results 
-                if r.content_type in allowed_types or r.content_type == content_type
-            ]
-        
-        # Sort by confidence
+        if allowed_types is not None:
+            all_results = [r for r in all_results if r.content_type in allowed_types]
+        
+        # Sort by confidence; nlargest keeps the same order for ties as the stable sort
+        if top_k is not None:
+            return heapq.nlargest(top_k, all_results, key=lambda x: x.confidence)
         all_results.sort(key=lambda x: x.confidence, reverse=True)
         
         return all_results
     
     async def close(self):
-        """Close all scraper sessions"""
-        for scraper in self.scrapers.values():
-            if scraper.session:
-                await scraper.session.close()
+        """Close the HTTP session shared by all scrapers"""
+        await close_shared_session()
 
@@ -3,32 +3,226 @@ Database Connection Module
 Handles SQLite database connections and session management
 """
 
-from sqlalchemy import create_engine
+import logging
+from sqlalchemy import LargeBinary, column, create_engine, event, inspect, table, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import contextmanager, asynccontextmanager
+from typing import AsyncGenerator, Generator, Optional
 
 from ..config import get_settings
-from .models import Base
+from ..utils import embedding_to_blob, json_dumps_bytes, json_loads
+from .models import Base, WorkMetadata
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def _json_serializer(value) -> str:
+    """JSON columns (allowed_uses, hyperparameters) encoded with orjson when available"""
+    return json_dumps_bytes(value).decode()
+
 
 # Create engine with SQLite-specific settings
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
+    json_serializer=_json_serializer,
+    json_deserializer=json_loads,
     echo=settings.DEBUG
 )
 
+# Applied to every new SQLite connection, sync and async: WAL lets readers run alongside a
+# writer, and the larger page cache / mmap keep hot lookups out of read() syscalls
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+# Async drivers for the same database, used where writes should not block the event loop
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+_async_engine = None
+_async_session_factory: Optional[async_sessionmaker] = None
+_async_unavailable = False
+
+
+# Set by init_db once the unique (title_normalized, content_type) index exists
+_upsert_supported = False
+
+# SQLite FTS5 index over work_metadata.title_normalized, an external-content table kept in
+# sync by triggers; join on work_fts.c.rowid == WorkMetadata.id and filter with MATCH
+WORK_FTS_TABLE = "work_fts"
+work_fts = table(WORK_FTS_TABLE, column("rowid"))
+
+_WORK_FTS_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {WORK_FTS_TABLE} USING fts5("
+    "title_normalized, content='work_metadata', content_rowid='id')",
+    f"CREATE TRIGGER IF NOT EXISTS {WORK_FTS_TABLE}_ai AFTER INSERT ON work_metadata BEGIN "
+    f"INSERT INTO {WORK_FTS_TABLE}(rowid, title_normalized) VALUES (new.id, new.title_normalized); "
+    "END",
+    f"CREATE TRIGGER IF NOT EXISTS {WORK_FTS_TABLE}_ad AFTER DELETE ON work_metadata BEGIN "
+    f"INSERT INTO {WORK_FTS_TABLE}({WORK_FTS_TABLE}, rowid, title_normalized) "
+    "VALUES ('delete', old.id, old.title_normalized); "
+    "END",
+    f"CREATE TRIGGER IF NOT EXISTS {WORK_FTS_TABLE}_au AFTER UPDATE OF title_normalized ON work_metadata BEGIN "
+    f"INSERT INTO {WORK_FTS_TABLE}({WORK_FTS_TABLE}, rowid, title_normalized) "
+    "VALUES ('delete', old.id, old.title_normalized); "
+    f"INSERT INTO {WORK_FTS_TABLE}(rowid, title_normalized) VALUES (new.id, new.title_normalized); "
+    "END",
+)
+
+# Set by init_db once the FTS5 title index and its triggers exist
+_fts_available = False
+
+
 def init_db():
     """Initialize database tables"""
+    global _upsert_supported, _fts_available
     Base.metadata.create_all(bind=engine)
+    _migrate_title_embeddings()
+    _upsert_supported = _ensure_work_indexes()
+    _fts_available = _ensure_work_fts()
+    analyze_works()
+
+
+def analyze_works():
+    """Refresh the query planner's statistics for work_metadata, e.g. after a bulk load"""
+    table = WorkMetadata.__tablename__
+    try:
+        with engine.begin() as conn:
+            if engine.dialect.name == "sqlite":
+                # Sample each index instead of reading it all, so this stays cheap on big tables
+                conn.execute(text("PRAGMA analysis_limit=1000"))
+            conn.execute(text(f"ANALYZE {table}"))
+    except Exception as e:
+        logger.warning(f"Could not analyze {table}: {e}")
+
+
+def _migrate_title_embeddings():
+    """Convert a title_embedding column from older databases (JSON arrays) to float16 blobs"""
+    table = WorkMetadata.__tablename__
+    column_types = {c["name"]: c["type"] for c in inspect(engine).get_columns(table)}
+    if isinstance(column_types.get("title_embedding"), LargeBinary):
+        return
+    
+    if engine.dialect.name == "sqlite":
+        retype = [
+            f"ALTER TABLE {table} DROP COLUMN title_embedding",
+            f"ALTER TABLE {table} ADD COLUMN title_embedding BLOB",
+        ]
+    elif engine.dialect.name == "postgresql":
+        retype = [f"ALTER TABLE {table} ALTER COLUMN title_embedding TYPE bytea USING NULL"]
+    else:
+        logger.warning(f"title_embedding is not a binary column on {engine.dialect.name}, not migrated")
+        return
+    
+    try:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                text(f"SELECT id, title_embedding FROM {table} WHERE title_embedding IS NOT NULL")
+            ).all()
+            for statement in retype:
+                conn.execute(text(statement))
+            
+            # Text on SQLite, already decoded by the driver on PostgreSQL
+            converted = []
+            for work_id, value in rows:
+                vector = json_loads(value) if isinstance(value, (str, bytes)) else value
+                if isinstance(vector, list) and vector:
+                    converted.append({"id": work_id, "blob": embedding_to_blob(vector)})
+            if converted:
+                conn.execute(
+                    text(f"UPDATE {table} SET title_embedding = :blob WHERE id = :id"), converted
+                )
+        logger.info(f"Migrated title_embedding to float16 blobs ({len(converted)} rows converted)")
+    except Exception as e:
+        logger.warning(f"Could not migrate title_embedding column: {e}")
+
+
+def _ensure_work_indexes() -> bool:
+    """Add indexes introduced later to older databases; True if the unique dedupe index is usable"""
+    unique_ok = engine.dialect.name in ("postgresql", "sqlite")
+    
+    for index in WorkMetadata.__table__.indexes:
+        try:
+            index.create(bind=engine, checkfirst=True)
+        except Exception as e:
+            # A unique index typically fails on pre-existing duplicate rows
+            logger.warning(f"Could not create index {index.name}: {e}")
+            if index.unique:
+                unique_ok = False
+    
+    # Drop indexes superseded by the ones above; idx_title_type only once uq_title_type exists
+    superseded = ["ix_work_metadata_last_verified_id"] + (["idx_title_type"] if unique_ok else [])
+    for name in superseded:
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        except Exception as e:
+            logger.warning(f"Could not drop index {name}: {e}")
+    
+    if not unique_ok:
+        logger.warning("Unique work index unavailable, upserts disabled")
+    return unique_ok
+
+
+def _ensure_work_fts() -> bool:
+    """Create the FTS5 title index and its sync triggers on SQLite; True if it is usable"""
+    if engine.dialect.name != "sqlite":
+        return False
+    
+    try:
+        with engine.begin() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": WORK_FTS_TABLE}
+            ).first()
+            for statement in _WORK_FTS_DDL:
+                conn.execute(text(statement))
+            if not exists:
+                # Index the rows written before the table existed
+                conn.execute(text(f"INSERT INTO {WORK_FTS_TABLE}({WORK_FTS_TABLE}) VALUES ('rebuild')"))
+    except Exception as e:  # e.g. SQLite built without FTS5
+        logger.warning(f"Full-text title index unavailable, using LIKE search: {e}")
+        return False
+    return True
+
+
+def upsert_supported() -> bool:
+    """Whether WorkMetadata can be written with INSERT ... ON CONFLICT"""
+    return _upsert_supported
+
+
+def fts_available() -> bool:
+    """Whether titles can be searched through the work_fts FTS5 index"""
+    return _fts_available
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -52,3 +246,62 @@ def get_db_context() -> Generator[Session, None, None]:
         raise
     finally:
         db.close()
+
+
+def _get_async_session_factory() -> Optional[async_sessionmaker]:
+    """Create the async engine on first use; None if no async driver is usable"""
+    global _async_engine, _async_session_factory, _async_unavailable
+    
+    if _async_session_factory is not None or _async_unavailable:
+        return _async_session_factory
+    
+    url = make_url(settings.DATABASE_URL)
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    # A second engine on an in-memory database would see a different, empty database
+    if driver is None or (url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")):
+        _async_unavailable = True
+        return None
+    
+    try:
+        _async_engine = create_async_engine(
+            url.set(drivername=driver),
+            json_serializer=_json_serializer,
+            json_deserializer=json_loads,
+            echo=settings.DEBUG
+        )
+    except Exception as e:  # Optional: aiosqlite / asyncpg / greenlet may be missing
+        logger.warning(f"Async database driver unavailable, using sync sessions: {e}")
+        _async_unavailable = True
+        return None
+    
+    if url.get_backend_name() == "sqlite":
+        event.listen(_async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+    _async_session_factory = async_sessionmaker(_async_engine, expire_on_commit=False)
+    return _async_session_factory
+
+
+def async_db_available() -> bool:
+    """Whether get_async_db_context can be used for this database"""
+    return _get_async_session_factory() is not None
+
+
+@asynccontextmanager
+async def get_async_db_context() -> AsyncGenerator[AsyncSession, None]:
+    """Async context manager for database sessions; check async_db_available first"""
+    factory = _get_async_session_factory()
+    if factory is None:
+        raise RuntimeError("No async database driver available")
+    
+    async with factory() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+
+async def close_async_db():
+    """Dispose of the async engine's connections"""
+    if _async_engine is not None:
+        await _async_engine.dispose()
@@ -6,7 +6,7 @@ Stores metadata only - NO copyrighted content
 from datetime import datetime
 from sqlalchemy import (
     Column, Integer, String, Float, DateTime, Text, 
-    Boolean, JSON, ForeignKey, Index
+    Boolean, JSON, LargeBinary, ForeignKey, Index, func
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -47,19 +47,29 @@ class WorkMetadata(Base):
     # Allowed uses (derived from copyright status)
     allowed_uses = Column(JSON, default=list)  # ['educational', 'personal', 'commercial', 'remix']
     
-    # Embedding for semantic search (stored as JSON array)
-    title_embedding = Column(JSON, nullable=True)
+    # Model embedding of the title for semantic search, float16 bytes (utils.embedding_to_blob)
+    title_embedding = Column(LargeBinary, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=func.now())
+    updated_at = Column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, server_default=func.now()
+    )
     last_verified_at = Column(DateTime, nullable=True)  # Last time we re-checked source
     
     # Indexes for fast searching
     __table_args__ = (
-        Index('idx_title_type', 'title_normalized', 'content_type'),
+        # Unique so collectors can upsert on it (also serves title/type lookups)
+        Index('uq_title_type', 'title_normalized', 'content_type', unique=True),
         Index('idx_creator', 'creator'),
         Index('idx_year', 'publication_year'),
+        # Per-type counts, listings and search filters; equality column first so a year
+        # range within a type is one index range scan
+        Index('idx_type_year', 'content_type', 'publication_year'),
+        # Verified-works training query (status IN (...) AND data_confidence >= ?)
+        Index('idx_status_confidence', 'copyright_status', 'data_confidence'),
+        # Keyset pagination of stale entries for the update scheduler
+        Index('idx_last_verified_id', 'last_verified_at', 'id'),
     )
 
 
@@ -10,11 +10,17 @@ from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 import logging
 import asyncio
+from datetime import datetime, timezone
 
 from .api.routes import router
-from .database.connection import init_db
+from .database.connection import init_db, close_async_db
+from .ai_search.search_engine import get_search_engine
+from .data_collection.collector import get_collector
 from .data_collection.scheduler import get_scheduler
+from .ml_model.predictor import get_predictor
 from .ml_model.trainer import get_trainer
+from .rule_engine.rule_engine import get_rule_engine
+from .rule_engine.smart_tag import get_tag_generator
 from .config import get_settings
 
 settings = get_settings()
@@ -33,20 +39,37 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting SCET System...")
     
+    settings.ensure_dirs()
+    
     # Initialize database
     logger.info("Initializing database...")
     init_db()
     
+    # Bind service singletons once so routes resolve them via app.state
+    app.state.predictor = get_predictor()
+    app.state.trainer = get_trainer()
+    app.state.search_engine = get_search_engine()
+    app.state.rule_engine = get_rule_engine()
+    app.state.tag_generator = get_tag_generator()
+    app.state.collector = get_collector()
+    app.state.scheduler = get_scheduler()
+    
     # Bootstrap ML model if needed
-    trainer = get_trainer()
+    trainer = app.state.trainer
     if trainer.predictor.get_model_stats().get('training_samples', 0) == 0:
         logger.info("Bootstrapping ML model with initial training data...")
         await trainer.bootstrap_model()
     
+    # Warm models before serving traffic
+    app.state.predictor.warmup()
+    app.state.search_engine.warmup()
+    
+    if settings.LOG_BATCH_ENABLE:
+        await app.state.search_engine.start_log_flusher()
+    
     # Start data update scheduler
     if not settings.DEBUG:
-        scheduler = get_scheduler()
-        await scheduler.start()
+        await app.state.scheduler.start()
         logger.info("Data update scheduler started")
     
     logger.info("SCET System started successfully!")
@@ -56,8 +79,10 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down SCET System...")
     
-    scheduler = get_scheduler()
-    await scheduler.stop()
+    await app.state.scheduler.stop()
+    await app.state.search_engine.stop_log_flusher()
+    await app.state.collector.close()
+    await close_async_db()
     
     logger.info("SCET System shutdown complete")
 
@@ -164,6 +189,13 @@ app.add_middleware(
 )
 
 
+# Request timestamp, read once and shared by handlers via request.state.now
+@app.middleware("http")
+async def add_request_time(request: Request, call_next):
+    request.state.now = datetime.now(timezone.utc)
+    return await call_next(request)
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -218,5 +250,6 @@ if __name__ == "__main__":
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        **settings.uvicorn_options()
     )
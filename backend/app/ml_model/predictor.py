@@ -4,6 +4,7 @@ Predicts copyright status and expiry using machine learning
 Supports incremental learning without pre-built datasets
 """
 
+import math
 import numpy as np
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
@@ -18,6 +19,17 @@ from ..schemas import CopyrightStatus
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# (feature index, reason) pairs for _generate_reasoning, applied when the feature is > 0.5
+_REASON_RULES = (
+    (2, "Published before the public domain threshold date"),  # before_pd_threshold
+    (3, "Published before 1900 (very likely public domain)"),  # pre_1900
+    (9, "Creator deceased for 70+ years"),  # death_70_plus
+    (10, "Creator deceased for 95+ years"),  # death_95_plus
+    (19, "Creator is a historical/classical figure"),  # is_classical
+    (7, "Published after 2000 (likely still protected)"),  # post_2000
+    (17, "Work appears to have corporate authorship"),  # is_corporate
+)
+
 
 class CopyrightPredictor:
     """
@@ -27,8 +39,20 @@ class CopyrightPredictor:
     - Improves with more searches
     """
     
+    # Status for each probability bin used by _interpret_probabilities, highest first
+    _STATUS_BINS = (
+        CopyrightStatus.PUBLIC_DOMAIN,
+        CopyrightStatus.LIKELY_EXPIRED,
+        CopyrightStatus.UNKNOWN,
+        CopyrightStatus.LIKELY_ACTIVE,
+        CopyrightStatus.ACTIVE,
+    )
+    
     def __init__(self):
         self.feature_extractor = FeatureExtractor()
+        self._feature_names = tuple(self.feature_extractor.get_feature_names())
+        self._default_duration = settings.DEFAULT_COPYRIGHT_DURATION_YEARS
+        self._corporate_duration = settings.CORPORATE_COPYRIGHT_DURATION_YEARS
         self.model_path = settings.MODEL_PATH / "copyright_predictor.pkl"
         
         # Model parameters (learned)
@@ -69,7 +93,7 @@ class CopyrightPredictor:
         This is NOT a pre-trained model - it's using logical defaults
         that the model will adjust through learning
         """
-        weights = np.zeros(feature_count)
+        weights = np.zeros(feature_count, dtype=np.float32)
         
         # Feature indices (from feature extractor)
         # These weights encode basic copyright logic
@@ -158,9 +182,48 @@ class CopyrightPredictor:
             'feature_importance': self._get_feature_importance(features),
         }
     
+    def predict_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Predict copyright status for many works at once
+        Each item takes the same keys as predict; scoring is a single matmul over the
+        (N, F) feature matrix, with status and confidence computed column-wise
+        """
+        if not items:
+            return []
+        
+        features = self.feature_extractor.extract_features_batch(items)
+        # Scores are float32 like the scalar path; the sigmoid runs in float64 as math.exp does
+        scores = (features @ self._weights + self._bias).astype(np.float64)
+        probabilities = self._sigmoid_vec(scores)
+        statuses, confidences = self._interpret_probabilities(probabilities, features)
+        importances = self._get_feature_importance_batch(features)
+        
+        results = []
+        for item, row, probability, status, confidence, importance in zip(
+            items, features, probabilities.tolist(), statuses, confidences.tolist(), importances
+        ):
+            expiry_info = self._estimate_expiry(
+                item.get('publication_year'), item.get('creator_death_year'),
+                item.get('content_type'), item.get('jurisdiction', 'US'), probability
+            )
+            results.append({
+                'status': status,
+                'probability_public_domain': probability,
+                'confidence': confidence,
+                'expiry_date': expiry_info.get('expiry_date'),
+                'years_until_expiry': expiry_info.get('years_until_expiry'),
+                'reasoning': self._generate_reasoning(row, probability, status),
+                'feature_importance': importance,
+            })
+        return results
+    
     def _sigmoid(self, x: float) -> float:
-        """Sigmoid activation function"""
-        return 1 / (1 + np.exp(-np.clip(x, -500, 500)))
+        """Sigmoid activation function (scalar path, avoids numpy dispatch)"""
+        return 1.0 / (1.0 + math.exp(-max(-500.0, min(500.0, x))))
+    
+    def _sigmoid_vec(self, x: np.ndarray) -> np.ndarray:
+        """Sigmoid activation function over an array of scores"""
+        return np.reciprocal(np.add(1.0, np.exp(-np.clip(x, -500, 500))))
     
     def _interpret_probability(
         self, 
@@ -192,6 +255,31 @@ class CopyrightPredictor:
         
         return status, confidence
     
+    def _interpret_probabilities(
+        self,
+        probabilities: np.ndarray,
+        features: np.ndarray
+    ) -> Tuple[List[CopyrightStatus], np.ndarray]:
+        """Column-wise version of _interpret_probability for an (N,) batch"""
+        p = probabilities
+        bins = np.select(
+            [p >= 0.85, p >= 0.65, p >= 0.35, p >= 0.15],
+            [0, 1, 2, 3],
+            default=4
+        )
+        statuses = [self._STATUS_BINS[b] for b in bins.tolist()]
+        
+        confidence = np.select(
+            [p >= 0.65, p >= 0.35],
+            [p, 0.5 - np.abs(p - 0.5)],
+            default=1 - p
+        )
+        completeness = (
+            np.where(features[:, 0] == 0.5, 0.7, 1.0)
+            * np.where(features[:, 8] == 0.5, 0.8, 1.0)
+        )
+        return statuses, confidence * completeness
+    
     def _assess_data_completeness(self, features: np.ndarray) -> float:
         """Assess how complete the input data is"""
         completeness = 1.0
@@ -227,7 +315,7 @@ class CopyrightPredictor:
         
         # Calculate based on death year (life + 70 rule)
         if creator_death_year:
-            duration = settings.DEFAULT_COPYRIGHT_DURATION_YEARS
+            duration = self._default_duration
             expiry_year = creator_death_year + duration
             years_until = expiry_year - current_year
             
@@ -239,7 +327,7 @@ class CopyrightPredictor:
         
         # Calculate based on publication year (95 years for corporate works)
         if publication_year:
-            duration = settings.CORPORATE_COPYRIGHT_DURATION_YEARS
+            duration = self._corporate_duration
             expiry_year = publication_year + duration
             years_until = expiry_year - current_year
             
@@ -263,29 +351,8 @@ class CopyrightPredictor:
         status: CopyrightStatus
     ) -> str:
         """Generate human-readable reasoning for the prediction"""
-        reasons = []
-        
         # Check key indicators
-        if features[2] > 0.5:  # before_pd_threshold
-            reasons.append("Published before the public domain threshold date")
-        
-        if features[3] > 0.5:  # pre_1900
-            reasons.append("Published before 1900 (very likely public domain)")
-        
-        if features[9] > 0.5:  # death_70_plus
-            reasons.append("Creator deceased for 70+ years")
-        
-        if features[10] > 0.5:  # death_95_plus
-            reasons.append("Creator deceased for 95+ years")
-        
-        if features[19] > 0.5:  # is_classical
-            reasons.append("Creator is a historical/classical figure")
-        
-        if features[7] > 0.5:  # post_2000
-            reasons.append("Published after 2000 (likely still protected)")
-        
-        if features[17] > 0.5:  # is_corporate
-            reasons.append("Work appears to have corporate authorship")
+        reasons = [reason for idx, reason in _REASON_RULES if features[idx] > 0.5]
         
         if not reasons:
             if probability > 0.5:
@@ -297,14 +364,12 @@ class CopyrightPredictor:
     
     def _get_feature_importance(self, features: np.ndarray) -> Dict[str, float]:
         """Get importance of each feature for this prediction"""
-        feature_names = self.feature_extractor.get_feature_names()
-        
         # Calculate contribution of each feature
         contributions = features * self._weights
         
         # Get top contributing features
         importance = {}
-        for i, (name, contrib) in enumerate(zip(feature_names, contributions)):
+        for name, contrib in zip(self._feature_names, contributions.tolist()):
             if abs(contrib) > 0.01:  # Only significant contributions
                 importance[name] = float(contrib)
         
@@ -317,6 +382,28 @@ class CopyrightPredictor:
         
         return sorted_importance
     
+    def _get_feature_importance_batch(self, features: np.ndarray) -> List[Dict[str, float]]:
+        """
+        Top 5 feature contributions for every row of an (N, F) matrix
+        A stable argsort along each row gives the same order, ties included, as the
+        sorted() in _get_feature_importance
+        """
+        contributions = (features * self._weights).astype(np.float64)
+        magnitudes = np.abs(contributions)
+        top = np.argsort(-magnitudes, axis=1, kind='stable')[:, :5]
+        top_values = np.take_along_axis(contributions, top, axis=1).tolist()
+        significant = (np.take_along_axis(magnitudes, top, axis=1) > 0.01).tolist()
+        
+        names = self._feature_names
+        return [
+            {names[i]: value for i, value, keep in zip(idx, values, keep_row) if keep}
+            for idx, values, keep_row in zip(top.tolist(), top_values, significant)
+        ]
+    
+    def warmup(self):
+        """Run one throwaway prediction so the first request isn't cold"""
+        self.predict(title="Warmup", publication_year=1900, content_type="book")
+    
     def train_incremental(
         self,
         title: str,
@@ -340,7 +427,10 @@ class CopyrightPredictor:
             content_type=content_type,
             jurisdiction=jurisdiction
         )
-        
+        self._train_on_features(features, actual_status)
+    
+    def _train_on_features(self, features: np.ndarray, actual_status: CopyrightStatus):
+        """One gradient step on an already extracted feature vector"""
         # Convert status to target
         if actual_status in [CopyrightStatus.PUBLIC_DOMAIN, CopyrightStatus.EXPIRED]:
             target = 1.0
@@ -358,7 +448,7 @@ class CopyrightPredictor:
         
         # Update weights using gradient descent
         gradient = error * prediction * (1 - prediction) * features
-        self._weights += self._learning_rate * gradient
+        self._weights += (self._learning_rate * gradient).astype(np.float32, copy=False)
         self._bias += self._learning_rate * error
         
         # Update training state
@@ -382,17 +472,10 @@ class CopyrightPredictor:
         self,
         samples: List[Dict[str, Any]]
     ):
-        """Train on multiple samples at once"""
-        for sample in samples:
-            self.train_incremental(
-                title=sample.get('title', ''),
-                actual_status=sample.get('status'),
-                creator=sample.get('creator'),
-                publication_year=sample.get('publication_year'),
-                creator_death_year=sample.get('creator_death_year'),
-                content_type=sample.get('content_type'),
-                jurisdiction=sample.get('jurisdiction', 'US')
-            )
+        """Train on multiple samples at once; features for the whole batch are extracted in one pass"""
+        features = self.feature_extractor.extract_features_batch(samples)
+        for sample, row in zip(samples, features):
+            self._train_on_features(row, sample.get('status'))
     
     def get_model_stats(self) -> Dict[str, Any]:
         """Get model statistics"""
@@ -428,8 +511,9 @@ class CopyrightPredictor:
         with open(self.model_path, 'rb') as f:
             model_data = pickle.load(f)
         
-        self._weights = model_data['weights']
-        self._bias = model_data['bias']
+        # Older pickles hold float64 weights; features are float32
+        self._weights = np.asarray(model_data['weights']).astype(np.float32, copy=False)
+        self._bias = float(model_data['bias'])
         self._training_samples = model_data.get('training_samples', 0)
         self._last_trained = model_data.get('last_trained')
         self._accuracy_history = model_data.get('accuracy_history', [])
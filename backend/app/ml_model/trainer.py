@@ -33,6 +33,7 @@ class IncrementalTrainer:
     """
     
     def __init__(self):
+        settings.ensure_dirs()
         self.predictor = get_predictor()
         self._pending_samples: List[Dict[str, Any]] = []
         self._training_threshold = settings.RETRAIN_THRESHOLD
@@ -5,11 +5,44 @@ Text processing, normalization, and helper functions
 
 import re
 import unicodedata
+import numpy as np
 from typing import Optional, List, Tuple
 from datetime import datetime
 import hashlib
+import json
+from functools import lru_cache
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
 
+
+def json_dumps_bytes(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def embedding_to_blob(embedding) -> bytes:
+    """Pack an embedding as float16 bytes for a BLOB column (an eighth of its JSON text size)"""
+    return np.asarray(embedding, dtype=np.float16).tobytes()
+
+
+def blob_to_embedding(blob: bytes) -> np.ndarray:
+    """Unpack a float16 embedding BLOB into a float32 vector"""
+    return np.frombuffer(blob, dtype=np.float16).astype(np.float32)
+
+
+@lru_cache(maxsize=100_000)
 def normalize_title(title: str) -> str:
     """
     Normalize title for consistent searching and matching
@@ -76,6 +109,7 @@ def extract_year_from_text(text: str) -> Optional[int]:
     return None
 
 
+@lru_cache(maxsize=100_000)
 def calculate_text_hash(text: str) -> str:
     """Calculate hash for text deduplication"""
     normalized = normalize_title(text)
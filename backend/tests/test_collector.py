@@ -0,0 +1,57 @@
+"""
+Tests for the data collector
+"""
+
+import asyncio
+
+from app.data_collection.collector import COPY_NULL, DataCollector
+from app.data_collection.scrapers import ScrapedWork
+
+
+class FakeScraper:
+    """Stands in for WebScraper, returning queued results and counting calls"""
+    
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+    
+    async def search_all(self, query, content_type=None, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+    
+    async def close(self):
+        pass
+
+
+def make_collector(*responses) -> DataCollector:
+    collector = DataCollector()
+    collector.scraper = FakeScraper(*responses)
+    return collector
+
+
+def test_search_cached_reuses_results():
+    work = ScrapedWork(title="Moby Dick", content_type="book")
+    collector = make_collector([work])
+    
+    first = asyncio.run(collector._search_cached("Moby Dick", "book"))
+    second = asyncio.run(collector._search_cached("moby dick", "book"))
+    
+    assert first == second == [work]
+    assert collector.scraper.calls == 1
+
+
+def test_search_cached_refetches_empty_results():
+    work = ScrapedWork(title="Moby Dick", content_type="book")
+    collector = make_collector([], [work])
+    
+    assert asyncio.run(collector._search_cached("Moby Dick", "book")) == []
+    assert asyncio.run(collector._search_cached("Moby Dick", "book")) == [work]
+    assert collector.scraper.calls == 2
+
+
+def test_copy_field_keeps_null_distinct_from_empty_string():
+    assert DataCollector._copy_field(None) == COPY_NULL
+    assert DataCollector._copy_field("") == '""'
+    assert DataCollector._copy_field("\\N") == '"\\N"'
+    assert DataCollector._copy_field('Say "Hi", Bob') == '"Say ""Hi"", Bob"'
+    assert DataCollector._copy_field(b"\x01\xff") == '"\\x01ff"'